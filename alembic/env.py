@@ -5,6 +5,8 @@ Supports both sync (for migrations) and async (for autogenerate) operations.
 """
 
 import asyncio
+import functools
+import re
 from logging.config import fileConfig
 
 from alembic import context
@@ -27,17 +29,19 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+# Async driver -> sync driver (aiosqlite -> pysqlite, asyncpg -> psycopg2)
+_ASYNC_DRIVER_RE = re.compile(r"\+(?:aiosqlite|asyncpg)")
+_SYNC_DRIVERS = {"+aiosqlite": "", "+asyncpg": "+psycopg2"}
+
+
+@functools.lru_cache(maxsize=1)
 def get_database_url() -> str:
     """Get database URL from Kiro config."""
     kiro_config = get_config()
     url = kiro_config.database.url
     
     # For sync migrations, convert async URL to sync
-    # aiosqlite -> pysqlite, asyncpg -> psycopg2
-    url = url.replace("+aiosqlite", "")
-    url = url.replace("+asyncpg", "+psycopg2")
-    
-    return url
+    return _ASYNC_DRIVER_RE.sub(lambda m: _SYNC_DRIVERS[m.group(0)], url)
 
 
 def run_migrations_offline() -> None:
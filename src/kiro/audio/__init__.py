@@ -2,13 +2,31 @@
 Kiro Audio Pipeline
 
 Modules for voice capture, wake word detection, VAD, and speech-to-text.
+
+Components are imported lazily (PEP 562) so that importing one audio module,
+or a CLI command that never touches audio, doesn't load PortAudio, webrtcvad
+and friends.
 """
 
-from kiro.audio.capture import AudioCapture
-from kiro.audio.wake_word import WakeWordDetector
-from kiro.audio.vad import VoiceActivityDetector
-from kiro.audio.stt import SpeechToText
-from kiro.audio.pipeline import AudioPipeline
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kiro.audio.capture import AudioCapture
+    from kiro.audio.pipeline import AudioPipeline
+    from kiro.audio.stt import SpeechToText
+    from kiro.audio.vad import VoiceActivityDetector
+    from kiro.audio.wake_word import WakeWordDetector
+
+_LAZY_IMPORTS = {
+    "AudioCapture": "kiro.audio.capture",
+    "WakeWordDetector": "kiro.audio.wake_word",
+    "VoiceActivityDetector": "kiro.audio.vad",
+    "SpeechToText": "kiro.audio.stt",
+    "AudioPipeline": "kiro.audio.pipeline",
+}
 
 __all__ = [
     "AudioCapture",
@@ -17,3 +35,17 @@ __all__ = [
     "SpeechToText",
     "AudioPipeline",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import audio components on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,22 @@
+"""
+Audio Sample Kernels
+
+Small allocation-free conversions shared by the audio detectors.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def float_to_int16(src: np.ndarray, dst: np.ndarray, scratch: np.ndarray) -> None:
+    """
+    Convert float32 audio in [-1, 1] to int16 PCM, saturating out of range.
+
+    A bare int16 cast wraps samples beyond full scale around to the
+    opposite sign, which the models hear as clicks. Samples are clipped
+    into scratch (float32, same length as src; may be src itself to clip
+    in place) and scaled straight into dst, so nothing is allocated.
+    """
+    np.clip(src, -1.0, 1.0, out=scratch)
+    np.multiply(scratch, 32767, out=dst, dtype=np.float32, casting="unsafe")
@@ -8,9 +8,12 @@ Provides audio chunks to the processing pipeline.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import queue
+import socket
 import threading
-from typing import Callable
+from typing import Any, Callable
 
 import numpy as np
 import sounddevice as sd
@@ -19,14 +22,51 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
+@functools.cache
+def _all_devices() -> sd.DeviceList:
+    """All PortAudio devices (enumeration can take tens of ms, so cached)."""
+    return sd.query_devices()
+
+
+@functools.cache
+def _device_info(device: str | int | None, kind: str) -> dict[str, Any]:
+    """Info for one device, or the default device of a kind (cached)."""
+    info: dict[str, Any] = sd.query_devices(device, kind)
+    return info
+
+
+def invalidate_device_cache() -> None:
+    """Forget cached device info (e.g. after a device is plugged in)."""
+    _all_devices.cache_clear()
+    _device_info.cache_clear()
+
+
+def _copy_first_channel(indata: np.ndarray, out: np.ndarray) -> None:
+    """Copy a mono block into a ring slot."""
+    np.copyto(out, indata[:, 0])
+
+
+def _mean_channels(indata: np.ndarray, out: np.ndarray) -> None:
+    """Downmix a multichannel block into a ring slot."""
+    np.mean(indata, axis=1, out=out)
+
+
 class AudioCapture:
     """
     Captures audio from microphone and provides chunks to callbacks.
 
-    Uses sounddevice for low-latency audio capture with a background thread
-    feeding an asyncio queue.
+    Uses sounddevice for low-latency audio capture. The audio thread copies
+    each block into a preallocated ring of slots and publishes it by bumping
+    a write index (single producer, single consumer, no locks). A byte on a
+    socketpair wakes the event loop, which resumes the waiting consumer.
     """
 
+    # Number of ring slots (~12.8 s of audio at 100ms chunks)
+    RING_SLOTS = 128
+
+    # Unread chunks allowed before the oldest are dropped (bounds latency)
+    MAX_BACKLOG = 64
+
     def __init__(
         self,
         sample_rate: int = 16000,
@@ -39,7 +79,7 @@ class AudioCapture:
 
         Args:
             sample_rate: Audio sample rate in Hz (16000 for speech)
-            channels: Number of audio channels (1 for mono)
+            channels: Number of input channels (downmixed to mono)
             chunk_duration: Duration of each audio chunk in seconds
             device: Audio input device (None for default)
         """
@@ -51,7 +91,15 @@ class AudioCapture:
 
         self._stream: sd.InputStream | None = None
         self._running = False
-        self._audio_queue: asyncio.Queue[np.ndarray] = asyncio.Queue(maxsize=100)
+        self._ring = np.empty((self.RING_SLOTS, self.chunk_size), dtype=np.float32)
+        self._write_idx = 0  # Only advanced by the audio thread
+        self._read_idx = 0   # Only advanced by the event loop
+        self._fill = 0       # Samples written into the open slot
+        self._wakeup_r: socket.socket | None = None
+        self._wakeup_w: socket.socket | None = None
+        self._waiter: asyncio.Future[None] | None = None
+        self._dropped_frames = 0
+        self._to_mono: Callable[[np.ndarray, np.ndarray], None] = _copy_first_channel
         self._callbacks: list[Callable[[np.ndarray], None]] = []
         self._loop: asyncio.AbstractEventLoop | None = None
 
@@ -70,21 +118,33 @@ class AudioCapture:
         if not self._running:
             return
 
-        # Copy data (sounddevice reuses buffer)
-        audio_chunk = indata[:, 0].copy() if self.channels == 1 else indata.copy()
+        # PortAudio picks the block size, so reblock into fixed-size chunks:
+        # copy/downmix into the open ring slot and publish it once full
+        # (sounddevice reuses its buffer)
+        pos = 0
+        published = False
+        while pos < frames:
+            fill = self._fill
+            n = min(frames - pos, self.chunk_size - fill)
+            slot = self._ring[self._write_idx % self.RING_SLOTS]
+            self._to_mono(indata[pos:pos + n], slot[fill:fill + n])
+            pos += n
+            if fill + n == self.chunk_size:
+                self._fill = 0
+                self._write_idx += 1
+                published = True
+            else:
+                self._fill = fill + n
 
-        # Put in queue for async processing
-        loop = self._loop
-        if loop and self._running:
-            try:
-                loop.call_soon_threadsafe(
-                    self._audio_queue.put_nowait, audio_chunk
-                )
-            except asyncio.QueueFull:
-                pass  # Drop frame silently on overload
-            except RuntimeError:
-                # Event loop is closed - shutdown in progress
-                pass
+        if not published:
+            return
+
+        # Wake the consumer; a full socket buffer already means a pending
+        # wakeup (read the socket once, stop() may be clearing it)
+        wakeup = self._wakeup_w
+        if wakeup is not None:
+            with contextlib.suppress(BlockingIOError, OSError):
+                wakeup.send(b"\0")
 
     async def start(self) -> None:
         """Start audio capture."""
@@ -92,10 +152,20 @@ class AudioCapture:
             return
 
         self._loop = asyncio.get_running_loop()
+
+        self._to_mono = _copy_first_channel if self.channels == 1 else _mean_channels
+        self._write_idx = 0
+        self._read_idx = 0
+        self._fill = 0
+
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
+        self._loop.add_reader(self._wakeup_r.fileno(), self._drain_wakeups)
         self._running = True
 
         # Query device info for logging
-        device_info = sd.query_devices(self.device, "input")
+        device_info = _device_info(self.device, "input")
         logger.info(
             "audio_capture_starting",
             device=device_info["name"],
@@ -108,7 +178,8 @@ class AudioCapture:
             samplerate=self.sample_rate,
             channels=self.channels,
             dtype=np.float32,
-            blocksize=self.chunk_size,
+            blocksize=0,  # Let PortAudio use its native buffer size
+            latency="low",
             callback=self._audio_callback,
         )
         self._stream.start()
@@ -123,9 +194,6 @@ class AudioCapture:
         logger.info("audio_capture_stopping")
         self._running = False
         
-        # Clear loop reference to stop callback from queueing
-        self._loop = None
-
         if self._stream:
             try:
                 # Abort is faster than stop - doesn't wait for buffer to drain
@@ -135,38 +203,101 @@ class AudioCapture:
                 logger.warning("audio_stream_close_error", error=str(e))
             self._stream = None
 
-        # Clear queue and unblock any waiters
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        # Tear down the wakeup channel and discard unread chunks
+        if self._loop and self._wakeup_r:
+            self._loop.remove_reader(self._wakeup_r.fileno())
+        for sock in (self._wakeup_r, self._wakeup_w):
+            if sock:
+                sock.close()
+        self._wakeup_r = self._wakeup_w = None
+        self._loop = None
+        self._read_idx = self._write_idx
+
+        # Unblock a pending get_chunk()
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
 
         logger.info("audio_capture_stopped")
 
-    async def get_chunk(self, timeout: float = 1.0) -> np.ndarray | None:
+    def _drain_wakeups(self) -> None:
+        """Reader callback for the wakeup socket - runs on the event loop."""
+        wakeup = self._wakeup_r
+        if wakeup is not None:
+            with contextlib.suppress(BlockingIOError, OSError):
+                while wakeup.recv(4096):
+                    pass
+
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def get_chunk(self, timeout: float | None = None) -> np.ndarray | None:
         """
-        Get next audio chunk from queue.
+        Get next audio chunk from the ring.
+
+        Waits until the audio thread publishes a chunk; stop() wakes a pending
+        call, so no timeout is needed to notice shutdown.
 
-        Returns None on timeout or if not running.
+        The returned array is a view into the capture ring and is overwritten
+        once the ring wraps, so callers that keep audio around must copy it.
+
+        Returns None if not running (or on timeout, when one is given).
         """
-        if not self._running:
-            return None
+        while self._read_idx == self._write_idx:
+            if not self._running or self._loop is None:
+                return None
+            self._waiter = self._loop.create_future()
+            try:
+                if timeout is None:
+                    await self._waiter
+                else:
+                    await asyncio.wait_for(self._waiter, timeout=timeout)
+            except TimeoutError:
+                return None
+            finally:
+                self._waiter = None
+
+        # Consumer stalled: drop the oldest chunks rather than fall further
+        # behind (this also covers the producer lapping the ring)
+        backlog = self._write_idx - self._read_idx
+        if backlog > self.MAX_BACKLOG:
+            dropped = backlog - self.MAX_BACKLOG // 2
+            self._read_idx += dropped
+            self._dropped_frames += dropped
+            logger.warning(
+                "audio_frames_dropped",
+                dropped=dropped,
+                total_dropped=self._dropped_frames,
+            )
 
-        try:
-            return await asyncio.wait_for(self._audio_queue.get(), timeout=timeout)
-        except asyncio.TimeoutError:
-            return None
+        chunk: np.ndarray = self._ring[self._read_idx % self.RING_SLOTS]
+        self._read_idx += 1
+        return chunk
 
     @property
     def is_running(self) -> bool:
         """Check if capture is running."""
         return self._running
 
+    @property
+    def stream_time(self) -> float:
+        """
+        Stream time in seconds at the end of the last chunk from get_chunk().
+
+        Counts captured chunks (dropped ones included), so it follows the
+        audio itself rather than when the consumer got to it. Restarts at
+        zero with each start().
+        """
+        return self._read_idx * self.chunk_duration
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of chunks dropped because the consumer fell behind."""
+        return self._dropped_frames
+
     @staticmethod
     def list_devices() -> list[dict]:
         """List available audio input devices."""
-        devices = sd.query_devices()
+        devices = _all_devices()
         input_devices = []
         for i, dev in enumerate(devices):
             if dev["max_input_channels"] > 0:
@@ -181,7 +312,7 @@ class AudioCapture:
     @staticmethod
     def get_default_device() -> dict:
         """Get default input device info."""
-        device_info = sd.query_devices(kind="input")
+        device_info = _device_info(None, "input")
         return {
             "name": device_info["name"],
             "channels": device_info["max_input_channels"],
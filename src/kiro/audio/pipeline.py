@@ -8,8 +8,11 @@ Microphone → Wake Word → Recording → VAD → STT → Events
 from __future__ import annotations
 
 import asyncio
+import functools
+import math
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import structlog
@@ -19,6 +22,7 @@ from kiro.audio.wake_word import WakeWordDetector
 from kiro.audio.vad import VoiceActivityDetector
 from kiro.audio.stt import SpeechToText
 from kiro.events import Event, EventBus
+from kiro.utils.logging import debug_enabled
 
 if TYPE_CHECKING:
     from kiro.config import KiroConfig
@@ -41,10 +45,19 @@ class AudioPipeline:
     State machine:
     1. IDLE: Listen for wake word
     2. LISTENING: Record speech until silence
-    3. PROCESSING: Transcribe and emit result
-    4. Back to IDLE
+    3. Transcribe in the background and go straight back to IDLE
+       (PROCESSING only while waiting on a transcription backlog)
     """
 
+    # Safety cap on recording length (including pre-wake padding)
+    MAX_UTTERANCE_SECONDS = 30
+
+    # Transcriptions allowed in flight before new ones are awaited inline
+    MAX_PENDING_TRANSCRIPTIONS = 2
+
+    # Listening chunks quieter than this RMS (-60 dBFS) skip WebRTC VAD
+    SILENCE_GATE_RMS = 1e-3
+
     def __init__(
         self,
         event_bus: EventBus,
@@ -53,6 +66,8 @@ class AudioPipeline:
         audio_device: str | int | None = None,
         wake_word_threshold: float = 0.5,
         wake_word_refractory: float = 2.0,
+        wake_word_batch_size: int = 4,
+        wake_word_quantize: bool = False,
         vad_aggressiveness: int = 2,
         vad_min_speech: float = 0.25,
         vad_max_silence: float = 0.8,
@@ -61,7 +76,8 @@ class AudioPipeline:
         stt_model: str = "base",
         stt_language: str = "en",
         stt_device: str = "auto",
-        stt_compute_type: str = "float16",
+        stt_compute_type: str = "auto",
+        stt_batch_size: int | None = None,
         openai_api_key: str | None = None,
     ):
         """Initialize the audio pipeline with all components."""
@@ -80,6 +96,8 @@ class AudioPipeline:
             threshold=wake_word_threshold,
             refractory_period=wake_word_refractory,
             sample_rate=sample_rate,
+            batch_size=wake_word_batch_size,
+            quantize=wake_word_quantize,
         )
 
         self._vad = VoiceActivityDetector(
@@ -87,6 +105,7 @@ class AudioPipeline:
             aggressiveness=vad_aggressiveness,
             min_speech_duration=vad_min_speech,
             max_silence_duration=vad_max_silence,
+            chunk_duration=chunk_duration,
         )
 
         self._stt = SpeechToText(
@@ -97,13 +116,28 @@ class AudioPipeline:
             api_key=openai_api_key,
             device=stt_device,
             compute_type=stt_compute_type,
+            batch_size=stt_batch_size,
         )
 
+        # Utterance arena: chunks are copied in at a write offset, so the
+        # finished utterance is a view with no final concatenation
+        self._utterance_buf = np.empty(
+            int(sample_rate * self.MAX_UTTERANCE_SECONDS), dtype=np.float32
+        )
+        self._utterance_len = 0
+        self._spare_buffers: list[np.ndarray] = []
+        self._pending_transcriptions: set[asyncio.Task[None]] = set()
+
         # State
         self._state = PipelineState.IDLE
         self._running = False
-        self._audio_buffer: list[np.ndarray] = []
         self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # VAD runs off the event loop so ML jitter never stalls capture; the
+        # wake word detector has its own worker, so the two never block
+        # each other
+        self._vad_executor: ThreadPoolExecutor | None = None
 
     @classmethod
     def from_config(cls, config: "KiroConfig", event_bus: EventBus) -> "AudioPipeline":
@@ -124,6 +158,8 @@ class AudioPipeline:
             # Wake word
             wake_word_threshold=getattr(wake_cfg, "threshold", 0.5) if wake_cfg else 0.5,
             wake_word_refractory=getattr(wake_cfg, "refractory_period", 2.0) if wake_cfg else 2.0,
+            wake_word_batch_size=getattr(wake_cfg, "batch_size", 4) if wake_cfg else 4,
+            wake_word_quantize=getattr(wake_cfg, "quantize", False) if wake_cfg else False,
             # VAD
             vad_aggressiveness=getattr(vad_cfg, "aggressiveness", 2) if vad_cfg else 2,
             vad_min_speech=getattr(vad_cfg, "min_speech_duration", 0.25) if vad_cfg else 0.25,
@@ -133,7 +169,8 @@ class AudioPipeline:
             stt_model=getattr(stt_cfg, "model", "base") if stt_cfg else "base",
             stt_language=getattr(stt_cfg, "language", "en") if stt_cfg else "en",
             stt_device=getattr(stt_cfg, "device", "auto") if stt_cfg else "auto",
-            stt_compute_type=getattr(stt_cfg, "compute_type", "float16") if stt_cfg else "float16",
+            stt_compute_type=getattr(stt_cfg, "compute_type", "auto") if stt_cfg else "auto",
+            stt_batch_size=getattr(stt_cfg, "batch_size", None) if stt_cfg else None,
             openai_api_key=os.environ.get("OPENAI_API_KEY"),
         )
 
@@ -144,12 +181,16 @@ class AudioPipeline:
 
         logger.info("audio_pipeline_starting")
 
+        self._loop = asyncio.get_running_loop()
+
         # Start all components
         await self._capture.start()
         await self._wake_word.start()
         await self._vad.start()
         await self._stt.start()
 
+        self._vad_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
+
         self._running = True
         self._state = PipelineState.IDLE
 
@@ -175,6 +216,11 @@ class AudioPipeline:
                 pass
             self._task = None
 
+        for task in list(self._pending_transcriptions):
+            task.cancel()
+        if self._pending_transcriptions:
+            await asyncio.gather(*self._pending_transcriptions, return_exceptions=True)
+
         # Stop all components in reverse order
         try:
             await asyncio.wait_for(self._stt.stop(), timeout=1.0)
@@ -196,27 +242,57 @@ class AudioPipeline:
         except asyncio.TimeoutError:
             logger.warning("capture_stop_timeout")
 
+        if self._vad_executor:
+            self._vad_executor.shutdown(wait=False, cancel_futures=True)
+            self._vad_executor = None
+
         logger.info("audio_pipeline_stopped")
 
     async def _process_loop(self) -> None:
         """Main processing loop."""
         logger.debug("audio_process_loop_started")
 
+        chunk_count = 0
+        last_level_log = 0
+
         while self._running:
             try:
-                # Get audio chunk with short timeout for responsiveness
-                chunk = await self._capture.get_chunk(timeout=0.1)
+                # Blocks until audio arrives; None means capture stopped
+                chunk = await self._capture.get_chunk()
                 if chunk is None:
-                    # Check if we should still be running
-                    if not self._running:
-                        break
-                    continue
+                    break
+                # Detectors time speech and refractory periods on the
+                # audio's own clock
+                t = self._capture.stream_time
+
+                chunk_count += 1
+                if (
+                    chunk_count - last_level_log >= 50
+                    and debug_enabled(logger)
+                ):
+                    # Stay in float32 with no temporaries: np.dot is a fused
+                    # sum of squares, and max/min replace np.abs(chunk).max()
+                    last_level_log = chunk_count
+                    rms = math.sqrt(float(np.dot(chunk, chunk)) / chunk.size)
+                    peak = float(max(chunk.max(), -chunk.min()))
+                    logger.debug(
+                        "audio_level",
+                        rms=f"{rms:.4f}",
+                        peak=f"{peak:.4f}",
+                        state=self._state.name,
+                    )
 
                 # Process based on current state
                 if self._state == PipelineState.IDLE:
-                    await self._handle_idle(chunk)
+                    # Looking for wake word. Feed the VAD ring buffer too,
+                    # which captures pre-wake-word audio for better
+                    # transcription.
+                    self._vad.buffer_audio(chunk)
+                    detection = await self._wake_word.process_async(chunk, t=t)
+                    if detection:
+                        await self._on_wake(detection)
                 elif self._state == PipelineState.LISTENING:
-                    await self._handle_listening(chunk)
+                    await self._handle_listening(chunk, t)
                 # PROCESSING state is handled inline
 
             except asyncio.CancelledError:
@@ -230,60 +306,86 @@ class AudioPipeline:
 
         logger.debug("audio_process_loop_stopped")
 
-    async def _handle_idle(self, chunk: np.ndarray) -> None:
-        """Handle audio in IDLE state - looking for wake word."""
-        # Feed audio to VAD ring buffer even in idle state
-        # This captures pre-wake-word audio for better transcription
-        self._vad.buffer_audio(chunk)
-        
-        detection = self._wake_word.process(chunk)
+    async def _on_wake(self, detection: dict[str, Any]) -> None:
+        """Handle a wake word detection - start recording the utterance."""
+        logger.info("wake_word_triggered", score=round(detection["score"], 3))
 
-        if detection:
-            logger.info("wake_word_triggered", score=round(detection["score"], 3))
+        # Emit event
+        await self.event_bus.emit("audio.wake_word_detected", {
+            "model": detection["model"],
+            "score": detection["score"],
+        })
 
-            # Emit event
-            await self.event_bus.emit("audio.wake_word_detected", {
-                "model": detection["model"],
-                "score": detection["score"],
-            })
+        # Transition to listening
+        self._state = PipelineState.LISTENING
+        self._utterance_len = 0
 
-            # Transition to listening
-            self._state = PipelineState.LISTENING
-            self._audio_buffer = []
+        # Get padding audio (before wake word)
+        padding = self._vad.get_padding_audio()
+        if padding is not None:
+            padding = padding[-self._utterance_buf.size:]
+            self._utterance_buf[:padding.size] = padding
+            self._utterance_len = padding.size
 
-            # Get padding audio (before wake word)
-            padding = self._vad.get_padding_audio()
-            if padding is not None:
-                self._audio_buffer.append(padding)
+        self._vad.reset()
 
-            self._vad.reset()
+        await self.event_bus.emit("audio.utterance_started", {})
 
-            await self.event_bus.emit("audio.utterance_started", {})
-
-    async def _handle_listening(self, chunk: np.ndarray) -> None:
+    async def _handle_listening(self, chunk: np.ndarray, t: float) -> None:
         """Handle audio in LISTENING state - recording utterance."""
-        # Buffer audio
-        self._audio_buffer.append(chunk)
+        start = self._utterance_len
+        end = start + chunk.size
+        if end > self._utterance_buf.size:
+            # Safety: max recording length
+            logger.warning("utterance_too_long", samples=start)
+            self._utterance_len = 0
+            self._vad.reset()
+            self._state = PipelineState.IDLE
+            return
+
+        # Copy into the arena (chunk is a view into the capture ring)
+        self._utterance_buf[start:end] = chunk
+        self._utterance_len = end
 
-        # Check VAD
-        vad_result = self._vad.process(chunk)
+        # Check VAD (dead silence is settled with an energy check alone)
+        energy = float(np.dot(chunk, chunk))
+        if energy < self.SILENCE_GATE_RMS * self.SILENCE_GATE_RMS * chunk.size:
+            vad_result = self._vad.mark_silence(t=t)
+        elif self._loop is None:
+            raise RuntimeError("Audio pipeline not started")
+        else:
+            vad_result = await self._loop.run_in_executor(
+                self._vad_executor, functools.partial(self._vad.process, chunk, t=t)
+            )
 
         if vad_result["end_of_speech"]:
             logger.info(
                 "utterance_complete",
                 duration=round(vad_result["speech_duration"], 2),
-                chunks=len(self._audio_buffer),
+                samples=self._utterance_len,
             )
 
-            # Transition to processing
-            self._state = PipelineState.PROCESSING
-
-            # Combine audio
-            full_audio = np.concatenate(self._audio_buffer)
-            self._audio_buffer = []
-
-            # Transcribe
-            await self._transcribe_and_emit(full_audio)
+            # Hand the arena to the transcription and record into a spare
+            arena = self._utterance_buf
+            full_audio = arena[:self._utterance_len]
+            self._utterance_buf = (
+                self._spare_buffers.pop() if self._spare_buffers else np.empty_like(arena)
+            )
+            self._utterance_len = 0
+
+            if len(self._pending_transcriptions) < self.MAX_PENDING_TRANSCRIPTIONS:
+                # Transcribe in the background so the mic keeps flowing
+                task = asyncio.create_task(self._transcribe_in_background(full_audio, arena))
+                self._pending_transcriptions.add(task)
+                task.add_done_callback(self._pending_transcriptions.discard)
+            else:
+                # Backlogged: transcribe inline rather than pile up work
+                logger.warning(
+                    "transcription_backlog",
+                    pending=len(self._pending_transcriptions),
+                )
+                self._state = PipelineState.PROCESSING
+                await self._transcribe_in_background(full_audio, arena)
 
             # Back to idle
             self._wake_word.reset()
@@ -291,12 +393,14 @@ class AudioPipeline:
             self._state = PipelineState.IDLE
             logger.info("listening_for_wake_word")
 
-        elif len(self._audio_buffer) > 300:  # ~30 seconds at 100ms chunks
-            # Safety: max recording length
-            logger.warning("utterance_too_long", chunks=len(self._audio_buffer))
-            self._audio_buffer = []
-            self._vad.reset()
-            self._state = PipelineState.IDLE
+    async def _transcribe_in_background(self, audio: np.ndarray, arena: np.ndarray) -> None:
+        """Transcribe an utterance, then return its arena to the spare pool."""
+        try:
+            await self._transcribe_and_emit(audio)
+        except Exception as e:
+            logger.error("transcription_task_error", error=str(e), exc_info=True)
+        finally:
+            self._spare_buffers.append(arena)
 
     async def _transcribe_and_emit(self, audio: np.ndarray) -> None:
         """Transcribe audio and emit event with result."""
@@ -0,0 +1,148 @@
+"""
+In-process Piper Voice
+
+Runs a Piper voice model directly with ONNX Runtime (CUDA when available)
+instead of the piper CLI. Needs the optional onnxruntime-gpu and
+piper-phonemize packages; TextToSpeech falls back to the CLI without them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Special symbols in Piper's phoneme_id_map
+_PAD = "_"
+_BOS = "^"
+_EOS = "$"
+
+
+class PiperVoice:
+    """
+    A Piper voice loaded into an ONNX Runtime session.
+
+    Synthesis is blocking and yields int16 PCM one sentence at a time, so
+    callers can start playback after the first sentence.
+    """
+
+    def __init__(self, session: Any, config: dict[str, Any]):
+        """
+        Initialize the voice.
+
+        Args:
+            session: onnxruntime InferenceSession for the voice model
+            config: Parsed voice config (the model's .onnx.json file)
+        """
+        self._session = session
+        self._config = config
+        self._id_map: dict[str, list[int]] = config["phoneme_id_map"]
+        self._phoneme_type = config.get("phoneme_type", "espeak")
+        self._espeak_voice = config.get("espeak", {}).get("voice", "en-us")
+        self._num_speakers = config.get("num_speakers", 1)
+
+        inference = config.get("inference", {})
+        self._scales = np.array(
+            [
+                inference.get("noise_scale", 0.667),
+                inference.get("length_scale", 1.0),
+                inference.get("noise_w", 0.8),
+            ],
+            dtype=np.float32,
+        )
+
+    @classmethod
+    def load(cls, model_path: str | Path) -> PiperVoice | None:
+        """
+        Load a voice on the GPU.
+
+        Returns None if onnxruntime has no CUDA provider, piper-phonemize is
+        missing, or the model/config can't be read.
+        """
+        try:
+            import onnxruntime as ort
+            import piper_phonemize  # noqa: F401
+        except ImportError:
+            return None
+
+        if "CUDAExecutionProvider" not in ort.get_available_providers():
+            return None
+
+        try:
+            config = json.loads(Path(f"{model_path}.json").read_text())
+
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = max((os.cpu_count() or 2) // 2, 1)
+            session = ort.InferenceSession(
+                str(model_path),
+                sess_options=options,
+                providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+            )
+        except Exception as e:
+            logger.warning("piper_onnx_load_failed", model=str(model_path), error=str(e))
+            return None
+
+        logger.info("piper_onnx_loaded", model=Path(model_path).stem, providers=session.get_providers())
+        return cls(session, config)
+
+    @property
+    def sample_rate(self) -> int:
+        """Output sample rate of the voice."""
+        return int(self._config.get("audio", {}).get("sample_rate", 22050))
+
+    def synthesize(self, text: str) -> Iterator[bytes]:
+        """Synthesize text, yielding int16 PCM bytes per sentence."""
+        for phonemes in self._phonemize(text):
+            ids = self._phonemes_to_ids(phonemes)
+            if len(ids) > 2:  # More than BOS/EOS
+                yield self._synthesize_ids(ids)
+
+    def _phonemize(self, text: str) -> list[list[str]]:
+        """Split text into sentences of phonemes."""
+        from piper_phonemize import phonemize_codepoints, phonemize_espeak
+
+        sentences: list[list[str]]
+        if self._phoneme_type == "text":
+            sentences = phonemize_codepoints(text)
+        else:
+            sentences = phonemize_espeak(text, self._espeak_voice)
+        return sentences
+
+    def _phonemes_to_ids(self, phonemes: list[str]) -> list[int]:
+        """Map phonemes to model input ids (PAD after each, BOS/EOS around)."""
+        id_map = self._id_map
+        pad = id_map[_PAD]
+        ids = list(id_map[_BOS])
+        for phoneme in phonemes:
+            phoneme_ids = id_map.get(phoneme)
+            if phoneme_ids is None:
+                continue
+            ids.extend(phoneme_ids)
+            ids.extend(pad)
+        ids.extend(id_map[_EOS])
+        return ids
+
+    def _synthesize_ids(self, ids: list[int]) -> bytes:
+        """Run the model on one sentence and return int16 PCM."""
+        inputs = {
+            "input": np.array([ids], dtype=np.int64),
+            "input_lengths": np.array([len(ids)], dtype=np.int64),
+            "scales": self._scales,
+        }
+        if self._num_speakers > 1:
+            inputs["sid"] = np.array([0], dtype=np.int64)
+
+        audio: np.ndarray = self._session.run(None, inputs)[0].reshape(-1)
+
+        # Peak-normalize like Piper does
+        peak = max(float(np.abs(audio).max(initial=0.0)), 0.01)
+        np.multiply(audio, 32767.0 / peak, out=audio)
+        np.clip(audio, -32767.0, 32767.0, out=audio)
+        return audio.astype(np.int16).tobytes()
@@ -9,20 +9,196 @@ Transcribes audio to text using:
 from __future__ import annotations
 
 import asyncio
+import functools
 import io
+import operator
 import os
+import struct
 import tempfile
-import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import structlog
 
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
 logger = structlog.get_logger(__name__)
 
 STTEngine = Literal["faster-whisper", "whisper-api", "auto"]
 
+# Most aggressive quantization first (CTranslate2 compute types)
+_COMPUTE_TYPE_PREFERENCE = {
+    "cuda": ("int8_float16", "float16", "int8", "float32"),
+    "cpu": ("int8", "int8_float32", "float32"),
+}
+
+# On CPU, int8 and int8_float32 are the same compute type (int8 weights,
+# float32 elsewhere) whether or not VNNI is present; the only real split is
+# that without AVX2 (or ARM SDOT/UDOT) the int8 kernels are slow
+_CPU_INT8_FLAGS = frozenset({"avx2", "asimddp"})
+
+# Clips longer than this go through BatchedInferencePipeline; shorter ones
+# are a single VAD segment and gain nothing from batching
+_BATCHED_MIN_DURATION = 5.0
+
+# Greedy decoding with Whisper's temperature fallback: a chunk is only
+# re-decoded at higher temperature when it fails the compression-ratio or
+# log-prob checks, instead of paying for a 5-wide beam on every chunk
+_DECODE_OPTIONS = {
+    "beam_size": 1,
+    "best_of": 1,
+    "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+    "compression_ratio_threshold": 2.4,
+    "log_prob_threshold": -1.0,
+    "no_speech_threshold": 0.6,
+    "condition_on_previous_text": False,
+}
+
+# Segment text accessor for the aggregation loop
+_get_text = operator.attrgetter("text")
+
+# Canonical 44-byte RIFF/WAVE header for 16-bit mono PCM
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+# API uploads longer than this are converted while being sent rather than
+# materialized as one WAV up front
+_STREAMED_UPLOAD_MIN_DURATION = 10.0
+
+
+def _pack_wav_header(buffer: WriteableBuffer, sample_rate: int, data_size: int) -> None:
+    """Write a 16-bit mono PCM WAV header at the start of buffer."""
+    _WAV_HEADER.pack_into(
+        buffer, 0,
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1,  # PCM, mono
+        sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size,
+    )
+
+
+class _ReadOnlyStream(io.RawIOBase):
+    """
+    Seekable read-only file of known length.
+
+    Seekable so HTTP clients can size and retry an upload body.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(base + offset, 0)
+        return self._pos
+
+
+class _BufferStream(_ReadOnlyStream):
+    """File view of an in-memory buffer (io.BytesIO would copy a bytearray)."""
+
+    def __init__(self, buffer: bytearray):
+        super().__init__(len(buffer))
+        self._view = memoryview(buffer)
+
+    def readinto(self, b: WriteableBuffer) -> int:
+        data = self._view[self._pos:self._size]
+        out = memoryview(b).cast("B")
+        take = min(len(out), len(data))
+        out[:take] = data[:take]
+        self._pos += take
+        return take
+
+
+class _WavStream(_ReadOnlyStream):
+    """
+    Read-only WAV file view of float32 audio.
+
+    Samples are converted to int16 only as they are read, so an upload
+    can start immediately and never holds a full int16 copy.
+    """
+
+    def __init__(self, audio: np.ndarray, sample_rate: int):
+        super().__init__(_WAV_HEADER.size + audio.size * 2)
+        self._audio = audio
+        self._header = bytearray(_WAV_HEADER.size)
+        _pack_wav_header(self._header, sample_rate, audio.size * 2)
+
+    def readinto(self, b: WriteableBuffer) -> int:
+        out = memoryview(b).cast("B")
+        n = 0
+
+        # Header
+        if self._pos < _WAV_HEADER.size:
+            take = min(len(out), _WAV_HEADER.size - self._pos)
+            out[:take] = self._header[self._pos:self._pos + take]
+            n = take
+            self._pos += take
+
+        # Samples covering the rest of the request
+        if n < len(out) and self._pos < self._size:
+            offset = self._pos - _WAV_HEADER.size
+            first = offset // 2
+            skip = offset % 2
+            count = min(self._audio.size - first, (len(out) - n + skip + 1) // 2)
+            samples = np.multiply(
+                self._audio[first:first + count], 32767.0, dtype=np.float32
+            ).astype(np.int16)
+            data = memoryview(samples).cast("B")[skip:]
+            take = min(len(out) - n, len(data))
+            out[n:n + take] = data[:take]
+            n += take
+            self._pos += take
+
+        return n
+
+
+def _as_float32(audio: np.ndarray) -> np.ndarray:
+    """
+    Normalize audio to contiguous float32 in [-1, 1].
+
+    Float32 contiguous input (the pipeline's utterance buffer) is returned
+    as-is; int16 PCM is scaled in float32 without a float64 intermediate.
+    """
+    if audio.dtype == np.int16:
+        scaled: np.ndarray = np.multiply(audio, 1.0 / 32768.0, dtype=np.float32)
+        return scaled
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_flags() -> frozenset[str]:
+    """CPU feature flags from /proc/cpuinfo (empty if unavailable)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("flags", "Features"):
+                    return frozenset(value.split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+def _cpu_compute_preference() -> tuple[str, ...]:
+    """CPU compute types to try, best first, for this machine's ISA."""
+    flags = _cpu_flags()
+    # Unknown ISA: keep the default order and let loading fall back
+    if not flags or flags & _CPU_INT8_FLAGS:
+        return _COMPUTE_TYPE_PREFERENCE["cpu"]
+    return ("float32",)
+
 
 class SpeechToText:
     """
@@ -39,7 +215,8 @@ class SpeechToText:
         sample_rate: int = 16000,
         api_key: str | None = None,
         device: str = "auto",  # cuda, cpu, or auto
-        compute_type: str = "float16",  # float16, int8_float16, int8
+        compute_type: str = "auto",  # auto, int8_float16, float16, int8, float32
+        batch_size: int | None = None,
     ):
         """
         Initialize STT.
@@ -51,7 +228,10 @@ class SpeechToText:
             sample_rate: Audio sample rate
             api_key: OpenAI API key (for whisper-api)
             device: Device for faster-whisper (cuda/cpu/auto)
-            compute_type: Compute type for faster-whisper
+            compute_type: Compute type for faster-whisper ("auto" picks the
+                most aggressive quantization the device supports)
+            batch_size: Batch size for batched inference on long clips
+                (default: 16 on GPU, 8 on CPU)
         """
         self._engine_choice = engine
         self._model = model
@@ -60,17 +240,28 @@ class SpeechToText:
         self._api_key = api_key
         self._device = device
         self._compute_type = compute_type
+        self._batch_size = batch_size
 
         self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._engine: str | None = None
-        self._whisper_model = None  # faster-whisper model
+        self._whisper_model: Any = None  # faster-whisper model
+        self._batched_model: Any = None  # BatchedInferencePipeline over the same model
+        self._get_logprob: operator.attrgetter[float] | None = None  # Per-version segment field
         self._openai_client = None  # OpenAI client
 
+        # Model load and inference run on one dedicated thread; CTranslate2
+        # parallelizes internally (cpu_threads), so more callers would only
+        # oversubscribe the CPU
+        self._executor: ThreadPoolExecutor | None = None
+
     async def start(self) -> None:
         """Initialize the STT engine."""
         if self._running:
             return
 
+        self._loop = asyncio.get_running_loop()
+
         # Determine engine
         if self._engine_choice == "auto":
             self._engine = await self._detect_best_engine()
@@ -120,7 +311,7 @@ class SpeechToText:
     async def _init_faster_whisper(self) -> None:
         """Initialize faster-whisper model."""
         try:
-            from faster_whisper import WhisperModel
+            from faster_whisper import BatchedInferencePipeline, WhisperModel
 
             # Determine device
             device = self._device
@@ -131,7 +322,7 @@ class SpeechToText:
                 except ImportError:
                     device = "cpu"
 
-            compute_type = self._compute_type if device == "cuda" else "int8"
+            compute_type = self._select_compute_type(device)
 
             logger.info(
                 "stt_loading_model",
@@ -140,22 +331,36 @@ class SpeechToText:
                 compute_type=compute_type,
             )
 
-            # Load model (runs in thread pool to not block)
-            loop = asyncio.get_event_loop()
+            # Load model (runs on the STT thread to not block)
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
+            loop = self._loop
+            if loop is None:
+                raise RuntimeError("STT not started")
             self._whisper_model = await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: WhisperModel(
                     self._model,
                     device=device,
                     compute_type=compute_type,
+                    cpu_threads=os.cpu_count() or 0,
+                    num_workers=1,
                 )
             )
 
+            self._batched_model = BatchedInferencePipeline(model=self._whisper_model)
+            if self._batch_size is None:
+                self._batch_size = 16 if device == "cuda" else 8
+
+            # Pay first-inference costs (workspace allocation, kernel
+            # selection, VAD model load) now rather than on the first utterance
+            await loop.run_in_executor(self._executor, self._warm_up)
+
             self._running = True
             logger.info("stt_model_loaded", model=self._model, device=device)
 
         except Exception as e:
             logger.error("stt_faster_whisper_init_failed", error=str(e))
+            self._shutdown_executor()
             # Try falling back to API
             if self._api_key or os.environ.get("OPENAI_API_KEY"):
                 logger.info("stt_falling_back_to_api")
@@ -164,6 +369,74 @@ class SpeechToText:
             else:
                 self._running = False
 
+    def _warm_up(self) -> None:
+        """Run throwaway transcriptions of silence (runs on the STT thread)."""
+        import time
+        start_time = time.perf_counter()
+        silence = np.zeros(self.sample_rate, dtype=np.float32)
+
+        try:
+            # VAD off so silence still reaches the encoder and decoder
+            segments, _ = self._whisper_model.transcribe(
+                silence,
+                language=self.language,
+                vad_filter=False,
+                max_new_tokens=8,
+                **_DECODE_OPTIONS,
+            )
+            for _ in segments:
+                pass
+
+            # Loads the VAD model that real requests go through
+            segments, _ = self._batched_model.transcribe(
+                silence,
+                language=self.language,
+                batch_size=self._batch_size,
+                vad_filter=True,
+                **_DECODE_OPTIONS,
+            )
+            for _ in segments:
+                pass
+        except Exception as e:
+            logger.warning("stt_warmup_failed", error=str(e))
+            return
+
+        logger.debug("stt_warmed_up", latency=round(time.perf_counter() - start_time, 3))
+
+    def _select_compute_type(self, device: str) -> str:
+        """
+        Pick the CTranslate2 compute type for a device.
+
+        An explicit compute_type is honored when the device supports it;
+        otherwise the most aggressive supported quantization is used
+        (int8_float16 on GPU; on CPU int8 only with AVX2 or ARM
+        dot-product instructions, see _cpu_compute_preference).
+        """
+        try:
+            import ctranslate2
+            supported = ctranslate2.get_supported_compute_types(device)
+        except Exception as e:
+            logger.debug("stt_compute_type_probe_failed", device=device, error=str(e))
+            supported = None
+
+        if self._compute_type != "auto":
+            if supported is None or self._compute_type in supported:
+                return self._compute_type
+            logger.info(
+                "stt_compute_type_unsupported",
+                compute_type=self._compute_type,
+                device=device,
+            )
+
+        if device == "cpu":
+            preference = _cpu_compute_preference()
+        else:
+            preference = _COMPUTE_TYPE_PREFERENCE.get(device, _COMPUTE_TYPE_PREFERENCE["cpu"])
+        for compute_type in preference:
+            if supported is None or compute_type in supported:
+                return compute_type
+        return "default"
+
     async def _init_whisper_api(self) -> None:
         """Initialize OpenAI Whisper API client."""
         if not self._api_key:
@@ -185,16 +458,27 @@ class SpeechToText:
     async def stop(self) -> None:
         """Stop the STT service."""
         self._running = False
+
+        self._shutdown_executor()
+
         self._whisper_model = None
+        self._batched_model = None
         self._openai_client = None
         logger.info("stt_stopped")
 
+    def _shutdown_executor(self) -> None:
+        """Release the STT thread."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     async def transcribe(self, audio: np.ndarray) -> dict:
         """
         Transcribe audio to text.
 
         Args:
-            audio: Float32 audio samples at configured sample rate
+            audio: Float32 (or int16 PCM) audio samples at configured
+                sample rate
 
         Returns:
             dict with:
@@ -205,6 +489,8 @@ class SpeechToText:
         if not self._running:
             raise RuntimeError("STT not started")
 
+        # Convert once here so neither engine makes its own dtype copy
+        audio = _as_float32(audio)
         duration = len(audio) / self.sample_rate
         logger.debug("stt_transcribing", duration=round(duration, 2), engine=self._engine)
 
@@ -227,33 +513,14 @@ class SpeechToText:
         import time
         start_time = time.perf_counter()
 
-        # Run transcription in thread pool
-        loop = asyncio.get_event_loop()
-        segments, info = await loop.run_in_executor(
-            None,
-            lambda: self._whisper_model.transcribe(
-                audio,
-                language=self.language,
-                beam_size=5,
-                vad_filter=True,
-                vad_parameters=dict(min_silence_duration_ms=500),
-            )
-        )
-
-        # Collect all segments
-        text_parts = []
-        total_prob = 0.0
-        segment_count = 0
-
-        for segment in segments:
-            text_parts.append(segment.text)
-            # Handle different faster-whisper versions
-            prob = getattr(segment, 'avg_logprob', None) or getattr(segment, 'avg_log_prob', 0.0)
-            total_prob += prob
-            segment_count += 1
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("STT not started")
 
-        text = "".join(text_parts).strip()
-        confidence = (total_prob / segment_count) if segment_count > 0 else 0.0
+        # The single STT thread serves concurrent callers in arrival order
+        text, confidence = await loop.run_in_executor(
+            self._executor, self._run_faster_whisper, audio
+        )
 
         elapsed = time.perf_counter() - start_time
         logger.info(
@@ -270,17 +537,59 @@ class SpeechToText:
             "duration": duration,
         }
 
+    def _run_faster_whisper(self, audio: np.ndarray) -> tuple[str, float]:
+        """
+        Transcribe one clip with faster-whisper; returns (text, confidence).
+
+        faster-whisper returns a lazy generator and the encoder/decoder only
+        run while it is consumed, so the segments are collected here on the
+        STT thread rather than on the event loop.
+        """
+        # Long clips: batch the VAD-segmented chunks through the encoder
+        if len(audio) / self.sample_rate > _BATCHED_MIN_DURATION:
+            transcribe = functools.partial(
+                self._batched_model.transcribe, batch_size=self._batch_size
+            )
+        else:
+            transcribe = self._whisper_model.transcribe
+
+        segments, _ = transcribe(
+            audio,
+            language=self.language,
+            vad_filter=True,
+            vad_parameters={"min_silence_duration_ms": 500},
+            **_DECODE_OPTIONS,
+        )
+
+        # Collect all segments
+        segments = list(segments)
+        if not segments:
+            return "", 0.0
+
+        # Handle different faster-whisper versions (field name resolved once)
+        if self._get_logprob is None:
+            name = "avg_logprob" if hasattr(segments[0], "avg_logprob") else "avg_log_prob"
+            self._get_logprob = operator.attrgetter(name)
+
+        text = "".join(map(_get_text, segments)).strip()
+        confidence = sum(map(self._get_logprob, segments)) / len(segments)
+        return text, confidence
+
     async def _transcribe_api(self, audio: np.ndarray, duration: float) -> dict:
         """Transcribe using OpenAI Whisper API."""
         import time
         start_time = time.perf_counter()
 
-        # Convert to WAV format for API
-        wav_bytes = self._audio_to_wav(audio)
+        # Convert to WAV format for API (long clips convert as they upload)
+        wav_file: _ReadOnlyStream
+        if duration > _STREAMED_UPLOAD_MIN_DURATION:
+            wav_file = _WavStream(audio, self.sample_rate)
+        else:
+            wav_file = _BufferStream(self._audio_to_wav(audio))
 
         response = await self._openai_client.audio.transcriptions.create(
             model=self._model,
-            file=("audio.wav", wav_bytes, "audio/wav"),
+            file=("audio.wav", wav_file, "audio/wav"),
             language=self.language,
             response_format="verbose_json",
         )
@@ -303,21 +612,17 @@ class SpeechToText:
             "duration": duration,
         }
 
-    def _audio_to_wav(self, audio: np.ndarray) -> bytes:
-        """Convert float32 audio to WAV bytes."""
-        # Convert to int16
-        audio_int16 = (audio * 32767).astype(np.int16)
-
-        # Write to bytes buffer as WAV
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wav:
-            wav.setnchannels(1)
-            wav.setsampwidth(2)  # 16-bit
-            wav.setframerate(self.sample_rate)
-            wav.writeframes(audio_int16.tobytes())
-
-        buffer.seek(0)
-        return buffer.read()
+    def _audio_to_wav(self, audio: np.ndarray) -> bytearray:
+        """Convert float32 audio to a WAV file image."""
+        data_size = len(audio) * 2
+        buffer = bytearray(_WAV_HEADER.size + data_size)
+        _pack_wav_header(buffer, self.sample_rate, data_size)
+
+        # Scale in float32 and cast straight into the data chunk: one
+        # pass, no intermediate arrays
+        samples = np.frombuffer(buffer, dtype=np.int16, offset=_WAV_HEADER.size)
+        np.multiply(audio, 32767.0, out=samples, dtype=np.float32, casting="unsafe")
+        return buffer
 
     @property
     def is_running(self) -> bool:
@@ -8,20 +8,83 @@ with fallback to cloud providers.
 from __future__ import annotations
 
 import asyncio
+import collections
+import contextlib
+import functools
 import io
 import os
+import re
 import subprocess
 import tempfile
+import threading
 import time
 import wave
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Any
 
-import numpy as np
 import structlog
 
+from kiro.audio.piper_onnx import PiperVoice
+from kiro.utils.cache import PathCache
+
+if TYPE_CHECKING:
+    import openai
+
 logger = structlog.get_logger(__name__)
 
+# Pronunciation substitutions (matched case-insensitively, whole words)
+_PRONUNCIATIONS = (
+    ("Kiro's", "Keero's"),
+    ("Kiro", "Keero"),  # Key-row, not Cairo
+)
+_PRONUNCIATION_MAP = {word.lower(): spoken for word, spoken in _PRONUNCIATIONS}
+
+# One alternation, longest words first so they win over their prefixes
+_PRONUNCIATION_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        re.escape(word)
+        for word in sorted(_PRONUNCIATION_MAP, key=len, reverse=True)
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+
+
+class _PcmStream:
+    """
+    Stream of raw PCM chunks with cleanup that runs on close.
+
+    Closing an async generator that never started skips its finally block,
+    so process cleanup lives here instead: on_close runs exactly once on
+    the first aclose(), whether or not the stream was ever iterated.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncGenerator[bytes, None],
+        on_close: Callable[[], Awaitable[None]] | None = None,
+    ):
+        self._chunks = chunks
+        self._on_close = on_close
+
+    def __aiter__(self) -> _PcmStream:
+        return self
+
+    async def __anext__(self) -> bytes:
+        return await anext(self._chunks)
+
+    async def aclose(self) -> None:
+        """Close the chunk source and run the cleanup callback once."""
+        on_close, self._on_close = self._on_close, None
+        try:
+            await self._chunks.aclose()
+        finally:
+            if on_close is not None:
+                await on_close()
+
 
 class TextToSpeech:
     """
@@ -29,8 +92,19 @@ class TextToSpeech:
 
     Piper provides fast, high-quality local TTS without API costs.
     Falls back to OpenAI TTS if Piper is unavailable.
+
+    Playback goes through one int16 RawOutputStream opened at start(): the
+    PortAudio callback copies queued PCM straight into its output buffer,
+    so there is no float conversion and cancelling is just clearing the
+    queue.
     """
 
+    # Output stream block size in frames (~46ms at 22050 Hz)
+    OUTPUT_BLOCKSIZE = 1024
+
+    # Bytes read from Piper's stdout per streamed chunk
+    PIPER_READ_SIZE = 4096
+
     def __init__(
         self,
         piper_model: str | Path | None = None,
@@ -53,17 +127,35 @@ class TextToSpeech:
         """
         self._piper_model_name = piper_model or "en_US-amy-medium"
         self._models_dir = models_dir
+
         self.piper_path = self._find_piper(piper_path)
         self.piper_model = self._find_piper_model()
         self.sample_rate = sample_rate
         self._openai_api_key = openai_api_key or os.environ.get("OPENAI_API_KEY")
         self._openai_voice = openai_voice
+        self._openai_client: openai.AsyncOpenAI | None = None  # Created on first use, then reused
 
         self._running = False
-        self._current_playback: asyncio.Task | None = None
+        self._current_playback: asyncio.Task[None] | None = None
+        self._current_audio: _PcmStream | None = None
         self._on_interrupt: Callable[[], None] | None = None
         self._engine: str | None = None
 
+        # Piper process already loaded and waiting for the next utterance
+        self._piper_proc: asyncio.subprocess.Process | None = None
+
+        # In-process Piper on the GPU (when available) and its worker thread
+        self._piper_voice: PiperVoice | None = None
+        self._voice_executor: ThreadPoolExecutor | None = None
+
+        # Playback state shared with the PortAudio callback (guarded by lock)
+        self._output_stream: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._play_queue: collections.deque[memoryview] = collections.deque()
+        self._play_done: asyncio.Event | None = None
+        self._play_lock = threading.Lock()
+        self._silence = bytes(self.OUTPUT_BLOCKSIZE * 2)
+
     def _find_piper(self, piper_path: str | Path | None) -> str | None:
         """Find piper executable."""
         if piper_path:
@@ -73,9 +165,14 @@ class TextToSpeech:
 
         import shutil
 
-        # Check PATH
-        piper = shutil.which("piper")
+        # Check PATH. Scanning it is the one costly step, so the result is
+        # cached on disk per PATH value; everything else is a single stat
+        # and is checked fresh so newly installed copies are picked up
+        paths = PathCache()
+        key = f"piper|{os.environ.get('PATH', '')}"
+        piper = paths.get(key) or shutil.which("piper")
         if piper:
+            paths.set(key, piper)
             return piper
 
         # Check project-local installation
@@ -151,14 +248,25 @@ class TextToSpeech:
             return
 
         self._running = True
+        self._loop = asyncio.get_running_loop()
 
-        if self.piper_path and self.piper_model:
+        if self.piper_model:
+            await self._load_piper_voice()
+        if self._piper_voice:
+            # Play at the voice's own rate; it may not be Piper's 22050
+            self.sample_rate = self._piper_voice.sample_rate
+        self._open_output_stream()
+
+        if self.piper_model and (self._piper_voice or self.piper_path):
             self._engine = "piper"
+            if not self._piper_voice:
+                await self._prespawn_piper()
             logger.info(
                 "tts_started",
                 engine="piper",
                 model=Path(self.piper_model).stem,
                 piper_path=self.piper_path,
+                in_process=self._piper_voice is not None,
             )
         elif self._openai_api_key:
             self._engine = "openai"
@@ -179,27 +287,83 @@ class TextToSpeech:
 
         self._running = False
         await self.cancel_playback()
+        self._close_output_stream()
+        await self._kill_piper(self._piper_proc)
+        self._piper_proc = None
+        self._piper_voice = None
+        if self._openai_client:
+            await self._openai_client.close()
+            self._openai_client = None
+        if self._voice_executor:
+            self._voice_executor.shutdown(wait=False, cancel_futures=True)
+            self._voice_executor = None
         logger.info("tts_stopped")
 
+    def _open_output_stream(self) -> None:
+        """Open the int16 output stream used for all playback."""
+        try:
+            import sounddevice as sd
+
+            self._output_stream = sd.RawOutputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype="int16",
+                blocksize=self.OUTPUT_BLOCKSIZE,
+                callback=self._output_callback,
+            )
+            self._output_stream.start()
+        except Exception as e:
+            self._output_stream = None
+            logger.error("tts_output_stream_error", error=str(e))
+
+    def _close_output_stream(self) -> None:
+        """Close the output stream."""
+        if self._output_stream is None:
+            return
+        try:
+            self._output_stream.abort()
+            self._output_stream.close()
+        except Exception as e:
+            logger.warning("tts_output_stream_close_error", error=str(e))
+        self._output_stream = None
+
+    def _output_callback(self, outdata: Any, frames: int, time_info: Any, status: Any) -> None:
+        """Callback from sounddevice - runs in audio thread."""
+        out = memoryview(outdata).cast("B")
+        size = len(out)
+        pos = 0
+
+        with self._play_lock:
+            queue = self._play_queue
+            while pos < size and queue:
+                chunk = queue[0]
+                n = min(size - pos, len(chunk))
+                out[pos:pos + n] = chunk[:n]
+                pos += n
+                if n == len(chunk):
+                    queue.popleft()
+                else:
+                    queue[0] = chunk[n:]
+
+            done = None
+            if not queue and self._play_done is not None:
+                done, self._play_done = self._play_done, None
+
+        if pos < size:
+            out[pos:] = self._silence[:size - pos]
+
+        if done is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(done.set)
+
     def _preprocess_text(self, text: str) -> str:
         """
         Preprocess text for better TTS pronunciation.
         
         Handles custom pronunciations and text normalization.
         """
-        import re
-        
-        # Pronunciation substitutions (case-insensitive)
-        substitutions = {
-            r'\bKiro\b': 'Keero',      # Key-row, not Cairo
-            r'\bKiro\'s\b': "Keero's",
-        }
-        
-        result = text
-        for pattern, replacement in substitutions.items():
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        
-        return result
+        return _PRONUNCIATION_RE.sub(
+            lambda m: _PRONUNCIATION_MAP[m.group(0).lower()], text
+        )
 
     async def speak(
         self,
@@ -233,15 +397,16 @@ class TextToSpeech:
 
         # Generate and play audio
         try:
-            audio_data = await self._synthesize(text)
-            if audio_data is None:
+            audio = await self._synthesize(text)
+            if audio is None:
                 return False
 
             if on_start:
                 on_start()
 
+            self._current_audio = audio
             self._current_playback = asyncio.create_task(
-                self._play_audio(audio_data, on_complete)
+                self._play_audio(audio, on_complete)
             )
             return True
 
@@ -288,57 +453,202 @@ class TextToSpeech:
             self._current_playback = None
             logger.debug("tts_playback_cancelled")
 
-    async def _synthesize(self, text: str) -> bytes | None:
-        """Synthesize text to audio bytes."""
-        # Try Piper first
-        if self.piper_path and self.piper_model:
+        # A task cancelled before its first step never reaches _play_audio's
+        # cleanup, so release the stream (and its Piper process) here too
+        if self._current_audio is not None:
+            audio, self._current_audio = self._current_audio, None
+            await audio.aclose()
+
+    async def _synthesize(self, text: str) -> _PcmStream | None:
+        """
+        Synthesize text to a stream of raw PCM chunks.
+
+        Returns once the first chunk is available, so playback can start
+        while the rest of the utterance is still being synthesized.
+        """
+        # Try Piper first (in-process on the GPU, else the CLI)
+        if self._piper_voice:
+            audio = await self._synthesize_piper_voice(text)
+            if audio:
+                return audio
+        elif self.piper_path and self.piper_model:
             audio = await self._synthesize_piper(text)
             if audio:
                 return audio
 
         # Fall back to OpenAI
         if self._openai_api_key:
-            return await self._synthesize_openai(text)
+            audio_bytes = await self._synthesize_openai(text)
+            if audio_bytes:
+                return _PcmStream(self._single_chunk(audio_bytes))
+            return None
 
         logger.error("tts_no_engine", message="No TTS engine available")
         return None
 
-    async def _synthesize_piper(self, text: str) -> bytes | None:
-        """Synthesize using Piper TTS."""
+    async def _load_piper_voice(self) -> None:
+        """Load the Piper model in-process if ONNX Runtime has a GPU."""
+        if self._loop is None or self.piper_model is None:
+            return
+        self._voice_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+        self._piper_voice = await self._loop.run_in_executor(
+            self._voice_executor, PiperVoice.load, self.piper_model
+        )
+        if self._piper_voice is None:
+            self._voice_executor.shutdown(wait=False)
+            self._voice_executor = None
+
+    async def _synthesize_piper_voice(self, text: str) -> _PcmStream | None:
+        """Synthesize with the in-process Piper voice, one sentence at a time."""
         try:
             start_time = time.perf_counter()
-            logger.debug("tts_synthesizing", engine="piper", text_length=len(text))
+            logger.debug("tts_synthesizing", engine="piper-onnx", text_length=len(text))
 
-            # Run piper in subprocess
-            proc = await asyncio.create_subprocess_exec(
-                self.piper_path,
-                "--model", self.piper_model,
-                "--output-raw",
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            voice, loop = self._piper_voice, self._loop
+            if voice is None or loop is None:
+                return None
+
+            sentences = voice.synthesize(text)
+            first_chunk = await loop.run_in_executor(
+                self._voice_executor, next, sentences, None
+            )
+            if first_chunk is None:
+                return None
+
+            logger.debug(
+                "tts_first_audio",
+                engine="piper-onnx",
+                latency=round(time.perf_counter() - start_time, 3),
+            )
+            return _PcmStream(
+                self._stream_piper_voice(loop, sentences, first_chunk, start_time, len(text))
             )
 
-            stdout, stderr = await proc.communicate(input=text.encode())
+        except Exception as e:
+            logger.error("piper_onnx_error", error=str(e))
+            return None
+
+    async def _stream_piper_voice(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        sentences: Iterator[bytes],
+        first_chunk: bytes,
+        start_time: float,
+        text_length: int,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the remaining sentences, synthesizing each on the TTS thread."""
+        total = len(first_chunk)
+        yield first_chunk
+        while (chunk := await loop.run_in_executor(
+            self._voice_executor, next, sentences, None
+        )) is not None:
+            total += len(chunk)
+            yield chunk
+
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            "tts_synthesized",
+            engine="piper-onnx",
+            text_length=text_length,
+            audio_duration=round(total / 2 / self.sample_rate, 2),
+            latency=round(elapsed, 3),
+        )
+
+    async def _spawn_piper(self) -> asyncio.subprocess.Process:
+        """Start a Piper process that synthesizes whatever arrives on stdin."""
+        if not self.piper_path or not self.piper_model:
+            raise FileNotFoundError("Piper executable or model not found")
+        return await asyncio.create_subprocess_exec(
+            self.piper_path,
+            "--model", self.piper_model,
+            "--output-raw",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    async def _prespawn_piper(self) -> None:
+        """
+        Start the standby Piper process for the next utterance.
+
+        Piper's raw output has no utterance framing, so each process handles
+        one utterance (ended by closing stdin). Spawning the next one ahead
+        of time moves process start and model load off the speak path.
+        """
+        if self._piper_proc is not None or not self.piper_path:
+            return
+        try:
+            proc = await self._spawn_piper()
+        except FileNotFoundError:
+            logger.warning("piper_not_found", path=self.piper_path)
+            self.piper_path = None
+            return
+        except Exception as e:
+            logger.warning("piper_prespawn_error", error=str(e))
+            return
+
+        # An overlapping call may have filled the slot (or stop() run) while
+        # this one was spawning; keep a single standby process
+        if self._piper_proc is not None or not self._running:
+            await self._kill_piper(proc)
+        else:
+            self._piper_proc = proc
+
+    @staticmethod
+    async def _kill_piper(proc: asyncio.subprocess.Process | None) -> None:
+        """Terminate a Piper process if it is still running."""
+        if proc is None or proc.returncode is not None:
+            return
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+
+    @staticmethod
+    async def _single_chunk(audio_bytes: bytes) -> AsyncGenerator[bytes, None]:
+        """Wrap already-synthesized audio as a one-chunk stream."""
+        yield audio_bytes
+
+    async def _synthesize_piper(self, text: str) -> _PcmStream | None:
+        """Synthesize using Piper TTS, streaming its raw PCM output."""
+        proc = None
+        try:
+            start_time = time.perf_counter()
+            logger.debug("tts_synthesizing", engine="piper", text_length=len(text))
+
+            # Take the warm standby process (spawn one if it died or is missing)
+            proc, self._piper_proc = self._piper_proc, None
+            if proc is None or proc.returncode is not None:
+                proc = await self._spawn_piper()
+
+            stdin, stdout, stderr = proc.stdin, proc.stdout, proc.stderr
+            if stdin is None or stdout is None or stderr is None:
+                raise RuntimeError("Piper process started without pipes")
 
-            if proc.returncode != 0:
+            stdin.write(text.encode())
+            await stdin.drain()
+            stdin.close()
+
+            first_chunk = await stdout.read(self.PIPER_READ_SIZE)
+            if not first_chunk:
+                await proc.wait()
+                errors = await stderr.read()
                 logger.warning(
                     "piper_error",
                     returncode=proc.returncode,
-                    stderr=stderr.decode()[:200]
+                    stderr=errors.decode()[:200]
                 )
+                await self._finish_piper(proc)
                 return None
 
-            elapsed = time.perf_counter() - start_time
-            audio_duration = len(stdout) / 2 / self.sample_rate  # 16-bit = 2 bytes
-            logger.info(
-                "tts_synthesized",
+            logger.debug(
+                "tts_first_audio",
                 engine="piper",
-                text_length=len(text),
-                audio_duration=round(audio_duration, 2),
-                latency=round(elapsed, 3),
+                latency=round(time.perf_counter() - start_time, 3),
+            )
+            return _PcmStream(
+                self._stream_piper(proc, stdout, first_chunk, start_time, len(text)),
+                on_close=functools.partial(self._finish_piper, proc),
             )
-            return stdout
 
         except FileNotFoundError:
             logger.warning("piper_not_found", path=self.piper_path)
@@ -346,18 +656,60 @@ class TextToSpeech:
             return None
         except Exception as e:
             logger.error("piper_error", error=str(e))
+            if proc is not None:
+                await self._finish_piper(proc)
             return None
 
+    async def _stream_piper(
+        self,
+        proc: asyncio.subprocess.Process,
+        stdout: asyncio.StreamReader,
+        first_chunk: bytes,
+        start_time: float,
+        text_length: int,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Yield Piper's stdout until EOF.
+
+        The wrapping _PcmStream disposes of the process on close, so
+        cancelled playback kills Piper and no synthesis work is wasted on
+        audio nobody will hear.
+        """
+        total = len(first_chunk)
+        yield first_chunk
+        while chunk := await stdout.read(self.PIPER_READ_SIZE):
+            total += len(chunk)
+            yield chunk
+        await proc.wait()
+
+        elapsed = time.perf_counter() - start_time
+        audio_duration = total / 2 / self.sample_rate  # 16-bit = 2 bytes
+        logger.info(
+            "tts_synthesized",
+            engine="piper",
+            text_length=text_length,
+            audio_duration=round(audio_duration, 2),
+            latency=round(elapsed, 3),
+        )
+
+    async def _finish_piper(self, proc: asyncio.subprocess.Process) -> None:
+        """Dispose of a used Piper process and warm up the next one."""
+        await self._kill_piper(proc)
+        if self._running:
+            await self._prespawn_piper()
+
     async def _synthesize_openai(self, text: str) -> bytes | None:
         """Synthesize using OpenAI TTS."""
         try:
-            import openai
-
             logger.debug("tts_synthesizing", engine="openai", text_length=len(text))
 
-            client = openai.AsyncOpenAI(api_key=self._openai_api_key)
+            # One client for all calls so its connection pool (and the TLS
+            # session) is reused
+            if self._openai_client is None:
+                import openai
+                self._openai_client = openai.AsyncOpenAI(api_key=self._openai_api_key)
 
-            response = await client.audio.speech.create(
+            response = await self._openai_client.audio.speech.create(
                 model="tts-1",
                 voice=self._openai_voice,
                 input=text,
@@ -374,38 +726,50 @@ class TextToSpeech:
 
     async def _play_audio(
         self,
-        audio_data: bytes,
+        audio: _PcmStream,
         on_complete: Callable[[], None] | None = None,
     ) -> None:
-        """Play audio data through speakers."""
+        """Play streamed audio through speakers as chunks arrive."""
         try:
-            import sounddevice as sd
-
-            # Convert raw PCM to numpy array
-            # Piper outputs 16-bit signed PCM at 22050 Hz
-            audio = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-
-            logger.debug("tts_playing", samples=len(audio), duration=len(audio) / self.sample_rate)
-
-            # Play audio (blocking in thread)
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: sd.play(audio, samplerate=self.sample_rate, blocking=True)
+            if self._output_stream is None:
+                raise RuntimeError("No audio output stream")
+
+            logger.debug("tts_playing")
+
+            # Piper outputs 16-bit signed PCM at 22050 Hz, which the stream
+            # plays as-is
+            samples = 0
+            async for chunk in audio:
+                with self._play_lock:
+                    self._play_queue.append(memoryview(chunk).cast("B"))
+                samples += len(chunk) // 2
+
+            # Completion fires once the callback drains the queue
+            done = asyncio.Event()
+            with self._play_lock:
+                self._play_done = done
+
+            await done.wait()
+
+            logger.debug(
+                "tts_playback_complete",
+                samples=samples,
+                duration=samples / self.sample_rate,
             )
 
-            logger.debug("tts_playback_complete")
-
             if on_complete:
                 on_complete()
 
         except asyncio.CancelledError:
-            # Stop playback
-            import sounddevice as sd
-            sd.stop()
+            # Stop playback at the next callback
+            with self._play_lock:
+                self._play_queue.clear()
+                self._play_done = None
             raise
         except Exception as e:
             logger.error("tts_playback_error", error=str(e), exc_info=True)
+        finally:
+            await audio.aclose()
 
     @property
     def is_playing(self) -> bool:
@@ -6,13 +6,16 @@ Detects speech presence and end-of-utterance using WebRTC VAD.
 
 from __future__ import annotations
 
-import collections
 import time
+from typing import Any
 
 import numpy as np
 import structlog
 import webrtcvad
 
+from kiro.audio._kernels import float_to_int16
+from kiro.utils.logging import debug_enabled
+
 logger = structlog.get_logger(__name__)
 
 
@@ -32,6 +35,8 @@ class VoiceActivityDetector:
         min_speech_duration: float = 0.25,
         max_silence_duration: float = 0.8,
         padding_duration: float = 0.3,
+        batch_duration: float = 0.2,
+        chunk_duration: float = 0.1,
     ):
         """
         Initialize VAD.
@@ -43,6 +48,8 @@ class VoiceActivityDetector:
             min_speech_duration: Minimum speech to trigger "speaking" state
             max_silence_duration: Silence duration to trigger end-of-speech
             padding_duration: Extra audio to capture before/after speech
+            batch_duration: Audio accumulated before WebRTC VAD is run over it
+            chunk_duration: Duration of the chunks fed in (sizes the padding ring)
         """
         if sample_rate not in (8000, 16000, 32000, 48000):
             raise ValueError(f"Sample rate must be 8000, 16000, 32000, or 48000, got {sample_rate}")
@@ -60,22 +67,42 @@ class VoiceActivityDetector:
         # WebRTC VAD
         self._vad = webrtcvad.Vad(aggressiveness)
 
+        # Accumulator so WebRTC VAD runs over ~200ms at a time. Samples that
+        # don't fill a whole frame carry over to the next batch.
+        self._batch_size = max(int(sample_rate * batch_duration), self.frame_size)
+        self._pending = np.empty(self._batch_size * 2, dtype=np.float32)
+        self._pending_len = 0
+        self._pending_time = 0.0  # Stream time the pending samples end at
+        self._last_is_speech = False
+
+        # int16 conversion target for the whole frames of a batch
+        self._int16_scratch = np.empty(len(self._pending), dtype=np.int16)
+
         # State tracking
         self._is_speaking = False
         self._speech_start_time: float | None = None
         self._last_speech_time: float | None = None
         self._triggered = False
 
-        # Ring buffer for padding
+        # Preallocated ring of the most recent audio, for padding. Holds one
+        # incoming chunk per padding frame; chunks are copied in (they may be
+        # views into the capture ring, which gets overwritten).
         padding_frames = int(padding_duration / (frame_duration_ms / 1000))
-        self._ring_buffer: collections.deque = collections.deque(maxlen=padding_frames)
+        self._pad = np.zeros(padding_frames * int(sample_rate * chunk_duration), dtype=np.float32)
+        self._pad_write = 0   # Next write position
+        self._pad_filled = 0  # Valid samples (saturates at capacity)
+        self._linear_pad = np.empty_like(self._pad)  # Unwrapped copy for readers
 
         self._running = False
+        self._debug = False
 
     async def start(self) -> None:
         """Start the VAD."""
         self._running = True
         self.reset()
+        # Log level is fixed once logging is set up; resolve it once rather
+        # than building debug events that would be filtered out
+        self._debug = debug_enabled(logger)
         logger.info(
             "vad_started",
             min_speech=self.min_speech_duration,
@@ -93,7 +120,10 @@ class VoiceActivityDetector:
         self._speech_start_time = None
         self._last_speech_time = None
         self._triggered = False
-        self._ring_buffer.clear()
+        self._pad_write = 0
+        self._pad_filled = 0
+        self._pending_len = 0
+        self._last_is_speech = False
 
     def buffer_audio(self, audio_chunk: np.ndarray) -> None:
         """
@@ -102,15 +132,37 @@ class VoiceActivityDetector:
         Use this during IDLE state to capture pre-wake-word audio
         so it's available when utterance recording starts.
         """
-        # Store in ring buffer (speech flag doesn't matter for padding)
-        self._ring_buffer.append((audio_chunk.copy(), False))
+        self._buffer_padding(audio_chunk)
+
+    def _buffer_padding(self, audio_chunk: np.ndarray) -> None:
+        """Copy a chunk into the padding ring, overwriting the oldest audio."""
+        capacity = self._pad.size
+        if capacity == 0:
+            return
+        if audio_chunk.size >= capacity:
+            self._pad[:] = audio_chunk[-capacity:]
+            self._pad_write = 0
+            self._pad_filled = capacity
+            return
+
+        start = self._pad_write
+        end = start + audio_chunk.size
+        if end <= capacity:
+            self._pad[start:end] = audio_chunk
+        else:
+            split = capacity - start
+            self._pad[start:] = audio_chunk[:split]
+            self._pad[:end - capacity] = audio_chunk[split:]
+        self._pad_write = end % capacity
+        self._pad_filled = min(self._pad_filled + audio_chunk.size, capacity)
 
-    def process(self, audio_chunk: np.ndarray) -> dict:
+    def process(self, audio_chunk: np.ndarray, *, t: float | None = None) -> dict[str, Any]:
         """
         Process audio chunk for voice activity.
 
         Args:
             audio_chunk: Float32 audio samples
+            t: Stream time of the chunk in seconds (default: monotonic clock)
 
         Returns:
             dict with:
@@ -122,58 +174,157 @@ class VoiceActivityDetector:
         if not self._running:
             return {"is_speech": False, "is_speaking": False, "end_of_speech": False}
 
-        current_time = time.time()
+        current_time = time.monotonic() if t is None else t
+
+        # Accumulate until a full batch is available
+        start = self._pending_len
+        end = start + len(audio_chunk)
+        if end > len(self._pending):
+            grown = np.empty(end, dtype=np.float32)
+            grown[:start] = self._pending[:start]
+            self._pending = grown
+            self._int16_scratch = np.empty(end, dtype=np.int16)
+        self._pending[start:end] = audio_chunk
+        self._pending_len = end
+
+        self._buffer_padding(audio_chunk)
+
+        self._pending_time = current_time
+
+        if end < self._batch_size:
+            return {
+                "is_speech": self._last_is_speech,
+                "is_speaking": self._is_speaking,
+                "end_of_speech": False,
+                "speech_duration": 0.0,
+            }
+
+        result = self._run_pending()
+        if result is None:
+            return self._update(False, current_time)
+        return result
+
+    def mark_silence(self, *, t: float | None = None) -> dict[str, Any]:
+        """
+        Advance the state machine with a chunk known to be silent.
 
-        # Convert to int16 bytes for WebRTC VAD
-        audio_int16 = (audio_chunk * 32767).astype(np.int16)
+        Cheap path for chunks below the caller's energy gate: the chunk
+        itself skips the int16 conversion and WebRTC VAD. Returns the same
+        dict as process().
+        """
+        if not self._running:
+            return {"is_speech": False, "is_speaking": False, "end_of_speech": False}
 
-        # Process in frame_duration_ms chunks
-        is_speech_frames = []
-        for i in range(0, len(audio_int16) - self.frame_size + 1, self.frame_size):
-            frame = audio_int16[i : i + self.frame_size]
-            frame_bytes = frame.tobytes()
-            try:
-                is_speech = self._vad.is_speech(frame_bytes, self.sample_rate)
-                is_speech_frames.append(is_speech)
-            except Exception as e:
-                logger.warning("vad_error", error=str(e))
-                is_speech_frames.append(False)
+        # Audio still waiting for a full batch came before this chunk: run
+        # it now so its speech counts, then drop it, since samples after
+        # the gap aren't contiguous with it
+        if self._pending_len >= self.frame_size:
+            self._run_pending()
+        self._pending_len = 0
+        self._last_is_speech = False
 
-        # Aggregate: consider speech if any frame has speech
-        is_speech = any(is_speech_frames) if is_speech_frames else False
+        return self._update(False, time.monotonic() if t is None else t)
 
-        # Store in ring buffer for padding
-        self._ring_buffer.append((audio_chunk.copy(), is_speech))
+    def _run_pending(self) -> dict[str, Any] | None:
+        """
+        Run WebRTC VAD over the whole frames in the pending batch.
 
-        # State machine
+        Samples short of a frame stay pending. Returns the state update if
+        any frame had speech, or None (without updating) if none did.
+        """
+        # Convert whole frames to int16 for WebRTC VAD into the scratch
+        # buffer (clipping in place is fine, _pending is our own copy)
+        end = self._pending_len
+        n_frames = end // self.frame_size
+        used = n_frames * self.frame_size
+        audio_int16 = self._int16_scratch[:used]
+        batch = self._pending[:used]
+        float_to_int16(batch, audio_int16, batch)
+        leftover = end - used
+        self._pending[:leftover] = self._pending[used:end]
+        self._pending_len = leftover
+
+        # Process in frame_duration_ms chunks; speech if any frame has
+        # speech. Every frame is still fed in: WebRTC VAD keeps hangover
+        # state between frames, so skipping frames would change results.
+        # Frames are passed as memoryview slices (no bytes copies). WebRTC
+        # VAD only raises for malformed frames, which would fail alike for
+        # every frame, so one handler around the loop logs it once.
+        samples = audio_int16.data.cast("B")
+        frame_bytes = self.frame_size * 2
+        vad_is_speech = self._vad.is_speech
+        sample_rate = self.sample_rate
+        first_speech = last_speech = -1  # Byte offsets of speech frames
+        try:
+            for i in range(0, used * 2, frame_bytes):
+                if vad_is_speech(samples[i:i + frame_bytes], sample_rate):
+                    if first_speech < 0:
+                        first_speech = i
+                    last_speech = i
+        except Exception as e:
+            logger.warning("vad_error", error=str(e))
+        is_speech = first_speech >= 0
+        self._last_is_speech = is_speech
+        if not is_speech:
+            return None
+
+        # Date speech from the frames it was heard in, not from when the
+        # batch filled, so onset and end aren't held back by batching.
+        # The batch (with its carried-over samples) ends at _pending_time.
+        current_time = self._pending_time
+        batch_start = current_time - end / sample_rate
+        bytes_per_second = 2 * sample_rate
+        return self._update(
+            True,
+            current_time,
+            speech_start=batch_start + first_speech / bytes_per_second,
+            speech_end=batch_start + (last_speech + frame_bytes) / bytes_per_second,
+        )
+
+    def _update(
+        self,
+        is_speech: bool,
+        current_time: float,
+        speech_start: float | None = None,
+        speech_end: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run the speech/silence state machine for one chunk or batch.
+
+        speech_start/speech_end are the stream times of the first and last
+        speech in it, when known more precisely than current_time.
+        """
         end_of_speech = False
         speech_duration = 0.0
 
         if is_speech:
-            self._last_speech_time = current_time
+            self._last_speech_time = current_time if speech_end is None else speech_end
 
             if not self._is_speaking:
                 # Possible start of speech
                 if self._speech_start_time is None:
-                    self._speech_start_time = current_time
-                elif current_time - self._speech_start_time >= self.min_speech_duration:
+                    self._speech_start_time = current_time if speech_start is None else speech_start
+                if current_time - self._speech_start_time >= self.min_speech_duration:
                     # Enough speech to trigger
                     self._is_speaking = True
                     self._triggered = True
-                    logger.debug("speech_started")
+                    if self._debug:
+                        logger.debug("speech_started")
         else:
             # No speech in this chunk
-            if self._is_speaking and self._last_speech_time:
+            if self._is_speaking and self._last_speech_time is not None:
                 silence_duration = current_time - self._last_speech_time
                 if silence_duration >= self.max_silence_duration:
                     # End of speech
                     end_of_speech = True
-                    speech_duration = current_time - (self._speech_start_time or current_time)
-                    logger.debug(
-                        "speech_ended",
-                        duration=round(speech_duration, 2),
-                        silence=round(silence_duration, 2),
-                    )
+                    started = self._speech_start_time
+                    speech_duration = current_time - (current_time if started is None else started)
+                    if self._debug:
+                        logger.debug(
+                            "speech_ended",
+                            duration=round(speech_duration, 2),
+                            silence=round(silence_duration, 2),
+                        )
                     self.reset()
             elif not self._is_speaking:
                 # Reset if never triggered
@@ -187,10 +338,24 @@ class VoiceActivityDetector:
         }
 
     def get_padding_audio(self) -> np.ndarray | None:
-        """Get buffered audio from before speech started."""
-        if not self._ring_buffer:
+        """
+        Get buffered audio from before speech started, oldest first.
+
+        Returns a view into a preallocated buffer that the next call
+        overwrites, so callers must copy it out before asking again.
+        """
+        filled = self._pad_filled
+        if not filled:
             return None
-        return np.concatenate([chunk for chunk, _ in self._ring_buffer])
+        if filled < self._pad.size:
+            # Not wrapped yet: the oldest sample is at the start
+            self._linear_pad[:filled] = self._pad[:filled]
+            return self._linear_pad[:filled]
+        w = self._pad_write
+        k = filled - w
+        self._linear_pad[:k] = self._pad[w:]
+        self._linear_pad[k:] = self._pad[:w]
+        return self._linear_pad
 
     @property
     def is_running(self) -> bool:
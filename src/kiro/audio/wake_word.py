@@ -8,22 +8,100 @@ Triggers when user says "Hey Jarvis" (closest to "Hey Kiro" in built-in models).
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import structlog
 
+from kiro.audio._kernels import float_to_int16
+from kiro.utils.cache import CACHE_DIR
+
 logger = structlog.get_logger(__name__)
 
-# OpenWakeWord model loading is slow, so we do it lazily
-_oww_model = None
+# OpenWakeWord model loading is slow, so we do it lazily (keyed by
+# whether the int8 model was requested)
+_oww_models: dict[bool, Any] = {}
+
+
+def _quantized_model_path(model_path: str) -> str:
+    """
+    Get an int8 dynamically quantized copy of an ONNX model.
+
+    Quantized weights cut CPU inference time and memory traffic for the
+    always-on detector, at the cost of slight score drift (the threshold
+    may need lowering a little). Needs the optional onnx package; falls
+    back to the original model without it.
+    """
+    quantized = CACHE_DIR / "openwakeword" / "int8" / os.path.basename(model_path)
+    if quantized.exists():
+        return str(quantized)
+
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        logger.warning("wake_word_quantize_unavailable", message="pip install onnx")
+        return model_path
+
+    try:
+        quantized.parent.mkdir(parents=True, exist_ok=True)
+        tmp = quantized.with_suffix(".tmp")
+        quantize_dynamic(model_path, tmp, per_channel=True, weight_type=QuantType.QInt8)
+        tmp.replace(quantized)
+    except Exception as e:
+        logger.warning("wake_word_model_quantize_failed", error=str(e))
+        return model_path
+
+    logger.info("wake_word_model_quantized", path=str(quantized))
+    return str(quantized)
+
+
+def _optimized_model_path(model_path: str, variant: str = "") -> str:
+    """
+    Get a graph-optimized copy of an ONNX model, creating it on first use.
+
+    ONNX Runtime re-runs constant folding and op fusion on every load; the
+    optimized graph is saved once under the cache directory so later
+    startups load it directly. Optimization stops at the extended level so
+    the saved graph has no CPU-specific layouts (those are cheap and still
+    applied at load). The copy keeps the original file name (it becomes
+    the OpenWakeWord model name) and is keyed by the onnxruntime version,
+    since fused ops are specific to it (and by variant, e.g. "int8", so
+    differently prepared models of the same name don't collide). Falls
+    back to the original model if the copy can't be written.
+    """
+    import onnxruntime as ort
+
+    cache_dir = CACHE_DIR / "openwakeword" / f"ort-{ort.__version__}"
+    if variant:
+        cache_dir /= variant
+    optimized = cache_dir / os.path.basename(model_path)
+    if optimized.exists():
+        return str(optimized)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = optimized.with_suffix(".tmp")
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        options.optimized_model_filepath = str(tmp)
+        ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        tmp.replace(optimized)
+    except Exception as e:
+        logger.warning("wake_word_model_optimize_failed", error=str(e))
+        return model_path
+
+    logger.info("wake_word_model_optimized", path=str(optimized))
+    return str(optimized)
 
 
-def _get_oww_model():
-    """Lazy-load OpenWakeWord model."""
-    global _oww_model
-    if _oww_model is None:
+def _get_oww_model(quantize: bool = False) -> Any:
+    """Lazy-load OpenWakeWord model (optionally int8 quantized)."""
+    if quantize not in _oww_models:
         import openwakeword
         from openwakeword.model import Model
         
@@ -38,9 +116,18 @@ def _get_oww_model():
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Wake word model not found: {model_path}")
         
-        _oww_model = Model(wakeword_model_paths=[model_path])
-        logger.info("openwakeword_model_loaded", model="hey_jarvis")
-    return _oww_model
+        variant = ""
+        if quantize:
+            quantized_path = _quantized_model_path(model_path)
+            if quantized_path != model_path:
+                model_path, variant = quantized_path, "int8"
+
+        _oww_models[quantize] = Model(
+            wakeword_model_paths=[_optimized_model_path(model_path, variant)],
+            inference_framework="onnx",
+        )
+        logger.info("openwakeword_model_loaded", model="hey_jarvis", int8=bool(variant))
+    return _oww_models[quantize]
 
 
 class WakeWordDetector:
@@ -55,6 +142,8 @@ class WakeWordDetector:
         threshold: float = 0.5,
         refractory_period: float = 2.0,
         sample_rate: int = 16000,
+        batch_size: int = 4,
+        quantize: bool = False,
     ):
         """
         Initialize wake word detector.
@@ -63,15 +152,35 @@ class WakeWordDetector:
             threshold: Detection confidence threshold (0-1)
             refractory_period: Minimum seconds between detections
             sample_rate: Expected audio sample rate
+            batch_size: Chunks collected per model call (1 disables batching)
+            quantize: Use an int8 quantized copy of the model (needs onnx)
         """
         self.threshold = threshold
         self.refractory_period = refractory_period
         self.sample_rate = sample_rate
+        self.batch_size = max(1, batch_size)
+        self.quantize = quantize
 
-        self._model = None
-        self._last_detection_time: float = 0
+        self._model: Any = None  # OpenWakeWord Model
+        self._last_detection_time = float("-inf")
         self._running = False
 
+        # ONNX inference takes milliseconds per chunk, so it runs on a
+        # dedicated worker instead of the event loop
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Chunks are converted into an int16 batch buffer and predicted
+        # together: one predict() computes the melspectrogram for the whole
+        # batch and scores every 80 ms frame in it, at the cost of up to
+        # batch_size - 1 chunks of extra detection latency. Two buffers are
+        # used alternately, since OpenWakeWord keeps a view of the samples
+        # past the last 80 ms boundary until the next predict() call.
+        self._int16_bufs = np.empty((2, 0), dtype=np.int16)
+        self._int16_idx = 0
+        self._batch_fill = 0
+        self._clip_scratch = np.empty(0, dtype=np.float32)
+
     async def start(self) -> None:
         """Initialize the wake word model."""
         if self._running:
@@ -79,9 +188,15 @@ class WakeWordDetector:
 
         logger.info("wake_word_detector_starting", threshold=self.threshold)
 
-        # Load model in thread pool to avoid blocking
-        loop = asyncio.get_running_loop()
-        self._model = await loop.run_in_executor(None, _get_oww_model)
+        # Stream clocks restart with capture, so forget the last detection
+        self._last_detection_time = float("-inf")
+
+        # Load model on the inference worker to avoid blocking
+        self._loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wakeword")
+        self._model = await self._loop.run_in_executor(
+            self._executor, _get_oww_model, self.quantize
+        )
 
         self._running = True
         logger.info("wake_word_detector_started")
@@ -89,14 +204,42 @@ class WakeWordDetector:
     async def stop(self) -> None:
         """Stop the detector."""
         self._running = False
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("wake_word_detector_stopped")
 
-    def process(self, audio_chunk: np.ndarray) -> dict | None:
+    async def process_async(
+        self, audio_chunk: np.ndarray, *, t: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Process audio chunk for wake word detection on the inference worker.
+
+        Chunks are processed in order; OpenWakeWord keeps streaming feature
+        state, so none are skipped while the worker is busy.
+
+        Args:
+            audio_chunk: Float32 audio samples
+            t: Stream time of the chunk in seconds (default: monotonic clock)
+
+        Returns:
+            Detection dict with score if wake word detected, None otherwise
+        """
+        if not self._running or self._executor is None or self._loop is None:
+            return None
+        return await self._loop.run_in_executor(
+            self._executor, functools.partial(self.process, audio_chunk, t=t)
+        )
+
+    def process(
+        self, audio_chunk: np.ndarray, *, t: float | None = None
+    ) -> dict[str, Any] | None:
         """
         Process audio chunk for wake word detection.
 
         Args:
             audio_chunk: Float32 audio samples
+            t: Stream time of the chunk in seconds (default: monotonic clock)
 
         Returns:
             Detection dict with score if wake word detected, None otherwise
@@ -104,21 +247,34 @@ class WakeWordDetector:
         if not self._running or self._model is None:
             return None
 
-        import time
-        current_time = time.time()
+        current_time = time.monotonic() if t is None else t
 
-        # Check refractory period
+        # Check refractory period before doing any conversion or inference
         if current_time - self._last_detection_time < self.refractory_period:
             return None
 
         # Convert to int16 for OpenWakeWord (expects -32768 to 32767)
-        audio_int16 = (audio_chunk * 32767).astype(np.int16)
+        n = len(audio_chunk)
+        if self._int16_bufs.shape[1] != n * self.batch_size:
+            self._int16_bufs = np.empty((2, n * self.batch_size), dtype=np.int16)
+            self._clip_scratch = np.empty(n, dtype=np.float32)
+            self._batch_fill = 0
+        audio_int16 = self._int16_bufs[self._int16_idx]
+        start = self._batch_fill * n
+        float_to_int16(audio_chunk, audio_int16[start:start + n], self._clip_scratch)
+
+        self._batch_fill += 1
+        if self._batch_fill < self.batch_size:
+            return None
+        self._batch_fill = 0
+        self._int16_idx ^= 1
 
         # Run prediction
         prediction = self._model.predict(audio_int16)
 
         # Check for wake word detection
-        # OpenWakeWord returns dict with model names as keys
+        # OpenWakeWord returns dict with model names as keys (the score
+        # is the max over all frames in the batch)
         for model_name, scores in prediction.items():
             if isinstance(scores, np.ndarray):
                 score = float(scores[-1]) if len(scores) > 0 else 0.0
@@ -142,6 +298,7 @@ class WakeWordDetector:
 
     def reset(self) -> None:
         """Reset detector state (e.g., after handling an utterance)."""
+        self._batch_fill = 0
         if self._model:
             self._model.reset()
 
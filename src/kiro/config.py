@@ -11,6 +11,8 @@ Uses Pydantic for validation and type coercion.
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any, Literal
@@ -19,6 +21,10 @@ import yaml
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# LibYAML's C parser when PyYAML was built with it (safe_load always uses
+# the pure-Python one)
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def expand_path(path: str | Path | None) -> Path | None:
     """Expand ~ and environment variables in paths."""
@@ -102,6 +108,8 @@ class WakeWordConfig(BaseModel):
 
     threshold: float = 0.5
     refractory_period: float = 2.0
+    batch_size: int = 4  # Chunks per model call (1: lowest latency)
+    quantize: bool = False  # int8 model, faster on CPU (needs onnx)
 
 
 class VADConfig(BaseModel):
@@ -119,7 +127,8 @@ class STTConfig(BaseModel):
     model: str = "base"  # faster-whisper: tiny/base/small/medium/large-v3, api: whisper-1
     language: str = "en"
     device: str = "auto"  # cuda, cpu, or auto
-    compute_type: str = "float16"  # float16, int8_float16, int8
+    compute_type: str = "auto"  # auto, int8_float16, float16, int8, float32
+    batch_size: int | None = None  # Batched inference size (None: 16 GPU, 8 CPU)
 
 
 class TTSConfig(BaseModel):
@@ -209,26 +218,45 @@ def find_config_file() -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file (cached until the file changes)."""
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    return data if data else {}
+
+
 def load_yaml_config(path: Path | None) -> dict[str, Any]:
     """Load configuration from YAML file."""
-    if path is None or not path.exists():
+    if path is None:
+        return {}
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
         return {}
 
-    with open(path) as f:
-        data = yaml.safe_load(f)
-
-    return data if data else {}
+    # Callers get their own copy; the cached parse must stay pristine
+    return copy.deepcopy(_parse_yaml(str(path), mtime_ns))
 
 
 def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """Deep merge two dictionaries, with override taking precedence."""
-    result = base.copy()
-
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    result = dict(base)
+
+    # Walk nested overrides with an explicit stack; only dicts on a merged
+    # path are copied, so neither input is modified
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = dict(current)
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                target[key] = value
 
     return result
 
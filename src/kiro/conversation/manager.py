@@ -7,8 +7,8 @@ For Phase 2: In-memory context only (persistence comes with Memory system).
 
 from __future__ import annotations
 
+import asyncio
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Iterator
 
@@ -41,8 +41,20 @@ You exist to help your user stay on track, remember commitments, and feel suppor
 
 Current context: You are running on a Linux desktop. The user interacts with you via voice."""
 
+# Extra system prompt guidance per intent category
+_INTENT_GUIDANCE: dict[IntentCategory, str] = {
+    IntentCategory.CAPTURE: (
+        "The user seems to be capturing a task or commitment. "
+        "Help them clarify and confirm what they want to remember."
+    ),
+    IntentCategory.COMMAND: (
+        "The user is giving a direct command. "
+        "Acknowledge and confirm the action."
+    ),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationTurn:
     """A single turn in a conversation."""
 
@@ -58,37 +70,57 @@ class ConversationTurn:
 
 @dataclass
 class Conversation:
-    """An active conversation with context."""
+    """
+    An active conversation with context.
+
+    Turns are kept as the LLM Messages themselves (with intents alongside),
+    built once when added, so assembling a prompt is a list slice rather
+    than a Message per turn per call. Earlier turns keep their Message
+    objects, so consecutive prompts share an identical prefix.
+    """
+
+    # Turns retained (older ones are dropped)
+    MAX_TURNS = 20
 
     id: str
-    turns: deque[ConversationTurn] = field(default_factory=lambda: deque(maxlen=20))
+    messages: list[Message] = field(default_factory=list)
+    intents: list[Intent | None] = field(default_factory=list)
     created_at: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
 
     def add_turn(self, role: Role, content: str, intent: Intent | None = None) -> None:
         """Add a turn to the conversation."""
-        self.turns.append(ConversationTurn(
-            role=role,
-            content=content,
-            intent=intent,
-        ))
-        self.last_activity = time.time()
+        now = time.time()
+        self.messages.append(Message(role=role, content=content, timestamp=now))
+        self.intents.append(intent)
+        if len(self.messages) > self.MAX_TURNS:
+            del self.messages[0]
+            del self.intents[0]
+        self.last_activity = now
 
     def get_messages(self, max_turns: int | None = None) -> list[Message]:
         """Get conversation as LLM messages."""
-        turns = list(self.turns)
         if max_turns:
-            turns = turns[-max_turns:]
-        return [t.to_message() for t in turns]
+            return self.messages[-max_turns:]
+        return self.messages[:]
+
+    @property
+    def turns(self) -> list[ConversationTurn]:
+        """Turns with their intents (built on demand)."""
+        return [
+            ConversationTurn(m.role, m.content, m.timestamp, intent)
+            for m, intent in zip(self.messages, self.intents, strict=True)
+        ]
 
     def clear(self) -> None:
         """Clear conversation history."""
-        self.turns.clear()
+        self.messages.clear()
+        self.intents.clear()
 
     @property
     def turn_count(self) -> int:
         """Number of turns in conversation."""
-        return len(self.turns)
+        return len(self.messages)
 
     @property
     def duration(self) -> float:
@@ -113,6 +145,7 @@ class ConversationManager:
         system_prompt: str = KIRO_SYSTEM_PROMPT,
         max_context_turns: int = 10,
         conversation_timeout: float = 300.0,  # 5 minutes
+        prewarm: bool = True,
     ):
         """
         Initialize conversation manager.
@@ -122,23 +155,50 @@ class ConversationManager:
             system_prompt: Base system prompt
             max_context_turns: Max turns to include in context
             conversation_timeout: Seconds before conversation resets
+            prewarm: Warm up the LLM connection in the background on start
         """
         self.llm = llm_gateway
-        self.system_prompt = system_prompt
+        self.system_prompt = system_prompt  # Also builds the prompt cache
         self.max_context_turns = max_context_turns
         self.conversation_timeout = conversation_timeout
+        self.prewarm = prewarm
 
         self._conversation: Conversation | None = None
         self._running = False
+        self._prewarm_task: asyncio.Task[None] | None = None
+
+    @property
+    def system_prompt(self) -> str:
+        """Base system prompt."""
+        return self._system_prompt
+
+    @system_prompt.setter
+    def system_prompt(self, value: str) -> None:
+        # System prompts only vary by intent category, so each variant is
+        # built once here rather than joined for every utterance
+        self._system_prompt = value
+        self._prompt_cache: dict[IntentCategory, str] = {
+            category: f"{value}\n\n{guidance}"
+            for category, guidance in _INTENT_GUIDANCE.items()
+        }
 
     async def start(self) -> None:
         """Start the conversation manager."""
         self._running = True
+
+        # Connect to the LLM provider now rather than on the first utterance
+        # (with the base prompt that plain conversation turns are sent with)
+        if self.prewarm:
+            self._prewarm_task = asyncio.create_task(self.llm.warm_up(self._system_prompt))
+
         logger.info("conversation_manager_started")
 
     async def stop(self) -> None:
         """Stop the conversation manager."""
         self._running = False
+        if self._prewarm_task:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
         self._conversation = None
         logger.info("conversation_manager_stopped")
 
@@ -232,25 +292,13 @@ class ConversationManager:
         additional_context: str | None = None,
     ) -> str:
         """Build system prompt with current context."""
-        parts = [self.system_prompt]
-
-        # Add intent context
-        if intent.category == IntentCategory.CAPTURE:
-            parts.append(
-                "\nThe user seems to be capturing a task or commitment. "
-                "Help them clarify and confirm what they want to remember."
-            )
-        elif intent.category == IntentCategory.COMMAND:
-            parts.append(
-                "\nThe user is giving a direct command. "
-                "Acknowledge and confirm the action."
-            )
+        # Base prompt plus intent guidance, prebuilt per category
+        prompt = self._prompt_cache.get(intent.category, self._system_prompt)
 
         # Add additional context
         if additional_context:
-            parts.append(f"\nAdditional context: {additional_context}")
-
-        return "\n".join(parts)
+            return f"{prompt}\n\nAdditional context: {additional_context}"
+        return prompt
 
     def reset_conversation(self) -> None:
         """Reset current conversation."""
@@ -7,18 +7,60 @@ Uses regex patterns first, falls back to LLM for ambiguous cases.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 from kiro.utils.logging import get_logger
 
+try:
+    import re2  # Optional: linear-time matching (pip install kiro[re2])
+except ImportError:
+    re2 = None
+
 logger = get_logger(__name__)
 
 
+@functools.cache
+def _compile(pattern: str) -> Any:
+    """
+    Compile a pattern, with RE2 when it is installed.
+
+    Patterns are lowercase and matched against lowercased text (see _lower)
+    rather than with IGNORECASE, which would disable re's literal prefix
+    scan. RE2 matches in linear time so long transcripts can't trigger
+    runaway backtracking. Falls back to re for patterns RE2 rejects.
+    Compiled patterns are shared by every CapturePipeline in the process.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def _at_time(day: datetime, hour: int, minute: int = 0) -> datetime:
+    """The given day at hour:minute, with seconds cleared."""
+    return datetime(day.year, day.month, day.day, hour, minute)
+
+
+def _lower(text: str) -> str:
+    """Lowercase text one character for one, so match offsets fit the original."""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few characters lowercase to two ("İ"); leave those as they are
+        lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+    return lowered
+
+
 class CaptureIntent(Enum):
     """Types of capture intents."""
     TASK = "task"
@@ -76,7 +118,7 @@ class CapturePipeline:
     # Note: These should NOT match questions - check is_question() first
     TASK_PATTERNS = [
         (r"^(?:i )?need to (.+)", 0.85),  # Anchored to start to avoid "anything I need to"
-        (r"add (.+) to (?:my )?(?:list|tasks?|todo)", 0.90),
+        (r"(?m)^(?>.*?add )(.+) to (?:my )?(?:list|tasks?|todo)", 0.90),  # See COMPLETE_PATTERNS
         (r"^(?:i )?have to (.+)", 0.80),  # Anchored
         (r"^(?:i )?(?:gotta|got to) (.+)", 0.80),  # Anchored
         (r"^(?:i )?should (.+)", 0.70),  # Anchored
@@ -85,13 +127,25 @@ class CapturePipeline:
         (r"^remember (?:to |that i need to )?(.+)", 0.75),  # Anchored
     ]
 
+    # Every match of the patterns above contains one of these (lowercased).
+    # Used to skip a pattern list cheaply - keep in sync when editing patterns.
+    TASK_KEYWORDS = ("need to", "add", "have to", "gotta", "got to", "should", "task", "forget", "remember")
+
     # Patterns that indicate reminder intent
+    # The third field says whether a trailing time phrase is split off the
+    # message (see REMINDER_TIME_SUFFIX)
     REMINDER_PATTERNS = [
-        (r"remind me (?:to )?(.+?)(?:\s+(?:at|in|on|tomorrow|tonight|later).*)?$", 0.95),
-        (r"set a reminder (?:to |for )?(.+)", 0.95),
-        (r"alert me (?:to |about )?(.+)", 0.90),
+        (r"remind me (?:to )?(.+)$", 0.95, True),
+        (r"set a reminder (?:to |for )?(.+)", 0.95, False),
+        (r"alert me (?:to |about )?(.+)", 0.90, False),
         # Note: "tell me" removed as too broad - matches "tell me a joke" etc.
     ]
+    REMINDER_KEYWORDS = ("remind me", "set a reminder", "alert me")
+
+    # Start of a time phrase after the message ("call mom| at 5").
+    # Matched as a second pass instead of a lazy group in the pattern above,
+    # which backtracks quadratically on long runs of whitespace.
+    REMINDER_TIME_SUFFIX = r"\S(\s+)(?:at|in|on|tomorrow|tonight|later)\b"
 
     # Patterns for time extraction
     # Order matters! More specific patterns (tomorrow at X) must come before generic (at X)
@@ -124,6 +178,8 @@ class CapturePipeline:
         # Days of week
         (r"(?:on )?(monday|tuesday|wednesday|thursday|friday|saturday|sunday)", "weekday"),
     ]
+    # "day" covers today and the weekdays
+    TIME_KEYWORDS = ("in ", "at ", "day", "tomorrow", "tonight", "evening", "afternoon", "morning", "week")
 
     # Query patterns
     QUERY_PATTERNS = [
@@ -136,8 +192,9 @@ class CapturePipeline:
         (r"what do i (?:need|have) to do today", CaptureIntent.QUERY_TODAY, 0.95),
         (r"what(?:'s| is) (?:on )?(?:my )?(?:schedule|agenda)(?: (?:for )?today)?", CaptureIntent.QUERY_TODAY, 0.90),
         (r"(?:what(?:'s| is) the )?status (?:of|on) (.+)", CaptureIntent.QUERY_PROJECT, 0.90),
-        (r"how(?:'s| is) (.+) (?:going|coming along|progressing)", CaptureIntent.QUERY_PROJECT, 0.85),
+        (r"(?m)^(?>.*?how(?:'s| is) )(.+) (?:going|coming along|progressing)", CaptureIntent.QUERY_PROJECT, 0.85),  # See COMPLETE_PATTERNS
     ]
+    QUERY_KEYWORDS = ("what", "show", "list", "read", "task", "status", "how")
 
     # Context query patterns - asking about tasks for a specific place/context
     # These extract a location/context to search task titles
@@ -152,40 +209,51 @@ class CapturePipeline:
         # "what do I need from the store?"
         (r"what do i need (?:to get |to buy )?(?:at|from|for) (.+)", 0.90),
     ]
+    CONTEXT_QUERY_KEYWORDS = ("anything", "something", "what do i need")
 
     # Completion patterns
+    # A (.+) followed by more literal text is retried from every start
+    # position, which is quadratic on long input ("mark mark mark ...").
+    # Such patterns are anchored to a line start, with an atomic group that
+    # takes the first "mark " - if that one can't match, no later one can.
     COMPLETE_PATTERNS = [
         (r"(?:i )?(?:finished|completed|done with|did) (.+)", 0.85),
-        (r"mark (.+) (?:as )?(?:done|complete|finished)", 0.95),
+        (r"(?m)^(?>.*?mark )(.+) (?:as )?(?:done|complete|finished)", 0.95),
         (r"check off (.+)", 0.90),
-        (r"(.+) is (?:done|complete|finished)", 0.80),
+        (r"(?m)^(.+) is (?:done|complete|finished)", 0.80),
     ]
+    COMPLETE_KEYWORDS = ("finished", "complete", "done", "did", "mark", "check off")
+
+    # Parsed utterances kept for repeats (streaming finals, re-routing)
+    PARSE_CACHE_SIZE = 256
 
     def __init__(self):
         """Initialize the capture pipeline."""
         # Compile all patterns
         self._task_patterns = [
-            (re.compile(p, re.IGNORECASE), conf) 
+            (_compile(p), conf)
             for p, conf in self.TASK_PATTERNS
         ]
         self._reminder_patterns = [
-            (re.compile(p, re.IGNORECASE), conf)
-            for p, conf in self.REMINDER_PATTERNS
+            (_compile(p), conf, split_time)
+            for p, conf, split_time in self.REMINDER_PATTERNS
         ]
+        self._reminder_time_suffix = _compile(self.REMINDER_TIME_SUFFIX)
+        self._parse_cache: OrderedDict[str, ParsedCapture] = OrderedDict()
         self._time_patterns = [
-            (re.compile(p, re.IGNORECASE), kind)
+            (_compile(p), kind)
             for p, kind in self.TIME_PATTERNS
         ]
         self._query_patterns = [
-            (re.compile(p, re.IGNORECASE), intent, conf)
+            (_compile(p), intent, conf)
             for p, intent, conf in self.QUERY_PATTERNS
         ]
         self._context_query_patterns = [
-            (re.compile(p, re.IGNORECASE), conf)
+            (_compile(p), conf)
             for p, conf in self.CONTEXT_QUERY_PATTERNS
         ]
         self._complete_patterns = [
-            (re.compile(p, re.IGNORECASE), conf)
+            (_compile(p), conf)
             for p, conf in self.COMPLETE_PATTERNS
         ]
 
@@ -210,6 +278,16 @@ class CapturePipeline:
         
         return False
 
+    @staticmethod
+    def _patterns_for(
+        lowered: str, keywords: tuple[str, ...], patterns: list[Any]
+    ) -> list[Any]:
+        """Return patterns, or nothing if the text has none of their keywords."""
+        for keyword in keywords:
+            if keyword in lowered:
+                return patterns
+        return []
+
     def _strip_wake_word(self, text: str) -> str:
         """Strip wake word prefix from text for pattern matching."""
         text_lower = text.lower()
@@ -230,14 +308,39 @@ class CapturePipeline:
             ParsedCapture with detected intent and entities
         """
         text = text.strip()
+
+        # Results are copied in and out so callers can't modify the cache
+        cached = self._parse_cache.get(text)
+        if cached is None:
+            result = self._parse(text)
+            self._parse_cache[text] = replace(result, entities=dict(result.entities))
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+            return result
+
+        self._parse_cache.move_to_end(text)
+        result = replace(cached, entities=dict(cached.entities))
+        if result.intent == CaptureIntent.REMINDER:
+            # Relative times ("in 10 minutes") move with the clock
+            result.trigger_time = self._parse_time(_lower(text))
+        return result
+
+    def _parse(self, text: str) -> ParsedCapture:
+        """Parse stripped text without the cache."""
+        # Patterns run on the lowercased text; captures are sliced from the
+        # original by offset to keep the user's casing
+        lowered = _lower(text)
         text_no_wake = self._strip_wake_word(text)  # For anchored patterns
+        lowered_no_wake = lowered[len(text) - len(text_no_wake):]
         is_question = self._is_question(text)
         
         # Check for context queries first (e.g., "anything I need at Superstore?")
-        for pattern, confidence in self._context_query_patterns:
-            match = pattern.search(text)
+        for pattern, confidence in self._patterns_for(
+            lowered, self.CONTEXT_QUERY_KEYWORDS, self._context_query_patterns
+        ):
+            match = pattern.search(lowered)
             if match:
-                context = match.group(1).strip().rstrip("?.,!")
+                context = text[slice(*match.span(1))].strip().rstrip("?.,!")
                 result = ParsedCapture(
                     intent=CaptureIntent.QUERY_CONTEXT,
                     confidence=confidence,
@@ -247,40 +350,51 @@ class CapturePipeline:
                 return result
         
         # Check for standard queries (they're quick lookups)
-        for pattern, intent, confidence in self._query_patterns:
-            match = pattern.search(text)
+        for pattern, intent, confidence in self._patterns_for(
+            lowered, self.QUERY_KEYWORDS, self._query_patterns
+        ):
+            match = pattern.search(lowered)
             if match:
                 result = ParsedCapture(intent=intent, confidence=confidence)
                 if intent == CaptureIntent.QUERY_PROJECT and match.groups():
-                    result.project_name = match.group(1).strip()
+                    result.project_name = text[slice(*match.span(1))].strip()
                 logger.debug(f"Matched query: {intent.value} ({confidence:.0%})")
                 return result
 
         # Check for completion
-        for pattern, confidence in self._complete_patterns:
-            match = pattern.search(text)
+        for pattern, confidence in self._patterns_for(
+            lowered, self.COMPLETE_KEYWORDS, self._complete_patterns
+        ):
+            match = pattern.search(lowered)
             if match:
                 result = ParsedCapture(
                     intent=CaptureIntent.COMPLETE_TASK,
                     confidence=confidence,
-                    task_reference=match.group(1).strip(),
+                    task_reference=text[slice(*match.span(1))].strip(),
                 )
                 logger.debug(f"Matched completion: {result.task_reference}")
                 return result
 
         # Check for reminders (before tasks, since "remind me to X" should be reminder not task)
-        for pattern, confidence in self._reminder_patterns:
-            match = pattern.search(text)
+        for pattern, confidence, split_time in self._patterns_for(
+            lowered, self.REMINDER_KEYWORDS, self._reminder_patterns
+        ):
+            match = pattern.search(lowered)
             if match:
-                message = match.group(1).strip()
-                trigger_time = self._parse_time(text)
+                start, end = match.span(1)
+                if split_time:
+                    suffix = self._reminder_time_suffix.search(lowered[start:end])
+                    if suffix:
+                        end = start + suffix.start(1)
+                message = text[start:end].strip()
+                trigger_time = self._parse_time(lowered)
                 
                 result = ParsedCapture(
                     intent=CaptureIntent.REMINDER,
                     confidence=confidence,
                     reminder_message=message,
                     trigger_time=trigger_time,
-                    entities={"raw_time": self._extract_time_phrase(text)},
+                    entities={"raw_time": self._extract_time_phrase(lowered)},
                 )
                 logger.debug(f"Matched reminder: {message} at {trigger_time}")
                 return result
@@ -288,10 +402,12 @@ class CapturePipeline:
         # Check for tasks - BUT skip if this appears to be a question
         # Use text_no_wake since task patterns may be anchored to start
         if not is_question:
-            for pattern, confidence in self._task_patterns:
-                match = pattern.search(text_no_wake)
+            for pattern, confidence in self._patterns_for(
+                lowered, self.TASK_KEYWORDS, self._task_patterns
+            ):
+                match = pattern.search(lowered_no_wake)
                 if match:
-                    title = match.group(1).strip()
+                    title = text_no_wake[slice(*match.span(1))].strip()
                     # Clean up the title
                     title = self._clean_task_title(title)
                     
@@ -309,14 +425,17 @@ class CapturePipeline:
 
     def _parse_time(self, text: str) -> Optional[datetime]:
         """
-        Extract and parse time from text.
+        Extract and parse time from lowercased text.
         
         Returns:
             datetime for the trigger time, or None if no time specified
         """
         now = datetime.now()
+        tomorrow = now + timedelta(days=1)
         
-        for pattern, kind in self._time_patterns:
+        for pattern, kind in self._patterns_for(
+            text, self.TIME_KEYWORDS, self._time_patterns
+        ):
             match = pattern.search(text)
             if not match:
                 continue
@@ -341,46 +460,42 @@ class CapturePipeline:
                     return now + timedelta(minutes=30)
                     
                 elif kind == "noon":
-                    return now.replace(hour=12, minute=0, second=0, microsecond=0)
+                    return _at_time(now, 12)
                     
                 elif kind == "midnight":
-                    tomorrow = now + timedelta(days=1)
-                    return tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
+                    return _at_time(tomorrow, 0)
                     
                 elif kind == "tonight":
-                    return now.replace(hour=20, minute=0, second=0, microsecond=0)
+                    return _at_time(now, 20)
                     
                 elif kind == "evening":
-                    return now.replace(hour=18, minute=0, second=0, microsecond=0)
+                    return _at_time(now, 18)
                     
                 elif kind == "afternoon":
-                    return now.replace(hour=14, minute=0, second=0, microsecond=0)
+                    return _at_time(now, 14)
                     
                 elif kind == "morning":
                     if now.hour >= 12:
                         # If it's past noon, morning means tomorrow
-                        tomorrow = now + timedelta(days=1)
-                        return tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
-                    return now.replace(hour=9, minute=0, second=0, microsecond=0)
+                        return _at_time(tomorrow, 9)
+                    return _at_time(now, 9)
                     
                 elif kind == "tomorrow_time":
                     # Tomorrow with specific time
-                    tomorrow = now + timedelta(days=1)
                     hour, minute = self._parse_hhmm(match)
                     if hour is not None:
-                        return tomorrow.replace(hour=hour, minute=minute or 0, second=0, microsecond=0)
-                    return tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
+                        return _at_time(tomorrow, hour, minute or 0)
+                    return _at_time(tomorrow, 9)
                 
                 elif kind == "tomorrow":
                     # Tomorrow without specific time
-                    tomorrow = now + timedelta(days=1)
-                    return tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
+                    return _at_time(tomorrow, 9)
                     
                 elif kind == "today_time":
                     # Today with specific time
                     hour, minute = self._parse_hhmm(match)
                     if hour is not None:
-                        return now.replace(hour=hour, minute=minute or 0, second=0, microsecond=0)
+                        return _at_time(now, hour, minute or 0)
                     return None
                     
                 elif kind == "next_week" or kind == "week":
@@ -388,12 +503,12 @@ class CapturePipeline:
                     
                 elif kind == "weekday":
                     day_name = match.group(1).lower()
-                    return self._next_weekday(day_name)
+                    return self._next_weekday(day_name, now)
                     
                 elif kind == "absolute":
                     hour, minute = self._parse_hhmm(match)
                     if hour is not None:
-                        result = now.replace(hour=hour, minute=minute or 0, second=0, microsecond=0)
+                        result = _at_time(now, hour, minute or 0)
                         # If time is in the past, assume tomorrow
                         if result <= now:
                             result += timedelta(days=1)
@@ -406,33 +521,20 @@ class CapturePipeline:
         return None
 
     def _parse_hhmm(self, match) -> Tuple[Optional[int], Optional[int]]:
-        """Parse hour and minute from regex match groups."""
-        groups = match.groups()
-        
-        # Find hour and minute in groups
-        hour = None
-        minute = None
-        ampm = None
-        
-        for g in groups:
-            if g is None:
-                continue
-            if g.lower() in ("am", "pm"):
-                ampm = g.lower()
-            elif hour is None:
-                try:
-                    hour = int(g)
-                except ValueError:
-                    pass
-            elif minute is None:
-                try:
-                    minute = int(g)
-                except ValueError:
-                    pass
-        
-        if hour is None:
+        """
+        Parse hour and minute from a time match.
+
+        The hh:mm patterns all capture (hour, minute, am/pm) as groups 1-3.
+        """
+        hour_text, minute_text, ampm = match.groups()
+        if hour_text is None:
             return None, None
         
+        hour = int(hour_text)
+        minute = int(minute_text) if minute_text else None
+        if ampm:
+            ampm = ampm.lower()
+
         # Handle AM/PM
         if ampm == "pm" and hour < 12:
             hour += 12
@@ -444,22 +546,20 @@ class CapturePipeline:
         
         return hour, minute
 
-    def _next_weekday(self, day_name: str) -> datetime:
-        """Get the next occurrence of a weekday."""
+    def _next_weekday(self, day_name: str, now: datetime) -> datetime:
+        """Get the next occurrence of a weekday after now."""
         days = {
             "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
             "friday": 4, "saturday": 5, "sunday": 6
         }
         target = days.get(day_name, 0)
-        now = datetime.now()
         current = now.weekday()
         
         days_ahead = target - current
         if days_ahead <= 0:  # Target day already happened this week
             days_ahead += 7
         
-        result = now + timedelta(days=days_ahead)
-        return result.replace(hour=9, minute=0, second=0, microsecond=0)
+        return _at_time(now + timedelta(days=days_ahead), 9)
 
     def _extract_time_phrase(self, text: str) -> Optional[str]:
         """Extract the time-related phrase from text for logging."""
@@ -479,16 +579,17 @@ class CapturePipeline:
     def _clean_task_title(self, title: str) -> str:
         """Clean up extracted task title."""
         # Remove trailing time phrases
-        time_words = [
+        time_words = (
             "at", "by", "before", "tomorrow", "today", "tonight",
             "this morning", "this afternoon", "this evening"
-        ]
+        )
         
         title_lower = title.lower()
-        for word in time_words:
-            if title_lower.endswith(word):
-                title = title[:-len(word)].strip()
-                break
+        if title_lower.endswith(time_words):  # One check for the common no-suffix case
+            for word in time_words:
+                if title_lower.endswith(word):
+                    title = title[:-len(word)].strip()
+                    break
         
         # Remove trailing punctuation
         title = title.rstrip(".,!?")
@@ -8,6 +8,8 @@ and project tracking.
 from __future__ import annotations
 
 import asyncio
+import functools
+import re
 from datetime import datetime
 from typing import Callable, Optional, Awaitable
 
@@ -20,6 +22,33 @@ from kiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Word rewrites for matching task references (buying -> buy, the -> "")
+_REFERENCE_WORDS = {
+    "buying": "buy", "bought": "buy",
+    "calling": "call", "called": "call",
+    "getting": "get", "got": "get",
+    "making": "make", "made": "make",
+    "doing": "do", "did": "do", "done": "do",
+    "the": "", "a": "", "an": "", "my": "", "some": "",
+}
+_REFERENCE_RE = re.compile(r"\b(?:" + "|".join(_REFERENCE_WORDS) + r")\b")
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_reference(text: str) -> str:
+    """Normalize a task title or reference for matching."""
+    text = text.lower().strip()
+    # Normalize verb forms (buying -> buy) and drop articles in one pass
+    text = _REFERENCE_RE.sub(lambda m: _REFERENCE_WORDS[m.group()], text)
+    # Collapse whitespace
+    return " ".join(text.split())
+
+
+@functools.lru_cache(maxsize=1024)
+def _reference_words(normalized: str) -> frozenset[str]:
+    """Words of a normalized title, for overlap tests."""
+    return frozenset(normalized.split())
+
 
 class ExecutiveFunctionEngine:
     """
@@ -92,9 +121,29 @@ class ExecutiveFunctionEngine:
         Returns:
             Response text for TTS, or None if not an EFE intent
         """
-        # Parse the utterance
-        parsed = self.capture.parse(text)
-        
+        return await self.process_parsed(self.prepare(text), text)
+
+    def prepare(self, text: str) -> ParsedCapture:
+        """
+        Parse an utterance without acting on it.
+
+        Routers that need to inspect the intent before deciding can pass
+        the result to process_parsed instead of calling process, so the
+        text is only parsed once.
+        """
+        return self.capture.parse(text)
+
+    async def process_parsed(self, parsed: ParsedCapture, text: str) -> Optional[str]:
+        """
+        Act on an utterance already parsed by prepare.
+
+        Args:
+            parsed: Result of prepare(text)
+            text: The utterance it was parsed from
+
+        Returns:
+            Response text for TTS, or None if not an EFE intent
+        """
         if parsed.intent == CaptureIntent.UNKNOWN:
             return None  # Not an EFE intent, let LLM handle it
         
@@ -132,33 +181,22 @@ class ExecutiveFunctionEngine:
         """
         Quick check if text contains an EFE intent.
         
-        Use this for routing decisions before full processing.
+        Use this for routing decisions before full processing. If the
+        utterance will be processed afterwards, prefer prepare() and
+        process_parsed() so it is only parsed once.
         """
-        parsed = self.capture.parse(text)
-        return parsed.intent != CaptureIntent.UNKNOWN
+        return self.prepare(text).intent != CaptureIntent.UNKNOWN
 
     async def _handle_task(self, parsed: ParsedCapture, raw_text: str) -> str:
         """Handle task creation intent."""
         if not parsed.task_title:
             return "I heard you want to add a task, but I didn't catch what it was."
         
-        # Create capture record first
-        capture = self.store.create_capture(
+        # Capture record and task are written in one transaction
+        task = self.store.create_capture_and_task(
             raw_text=raw_text,
-            detected_intent="task",
-            confidence=parsed.confidence,
-        )
-        
-        # Create the task
-        task = self.store.create_task(
             title=parsed.task_title,
-            source_utterance=raw_text,
-            capture_id=capture.id,
-        )
-        
-        # Mark capture as processed
-        self.store.mark_capture_processed(
-            capture.id, converted_to="task"
+            confidence=parsed.confidence,
         )
         
         logger.info(f"Created task: {task.title} (id={task.id})")
@@ -176,25 +214,14 @@ class ExecutiveFunctionEngine:
             trigger_time = datetime.now() + timedelta(hours=1)
             logger.debug("No time specified, defaulting to 1 hour")
         
-        # Create capture record
-        capture = self.store.create_capture(
+        # Capture record and reminder are written in one transaction
+        reminder = self.store.create_capture_and_reminder(
             raw_text=raw_text,
-            detected_intent="reminder",
-            confidence=parsed.confidence,
-        )
-        
-        # Create the reminder
-        reminder = self.store.create_reminder(
             message=parsed.reminder_message,
             trigger_time=trigger_time,
-            source_utterance=raw_text,
-            capture_id=capture.id,
-        )
-        
-        # Mark capture as processed
-        self.store.mark_capture_processed(
-            capture.id, converted_to="reminder"
+            confidence=parsed.confidence,
         )
+        self.scheduler.wake()
         
         logger.info(f"Created reminder: {reminder.message} at {trigger_time}")
         return self.queries.confirm_reminder_created(reminder)
@@ -210,21 +237,25 @@ class ExecutiveFunctionEngine:
         
         # Normalize reference: remove common verb forms
         reference_normalized = self._normalize_task_reference(reference)
+        titles_normalized = [self._normalize_task_reference(task.title) for task in tasks]
         
         # Exact match (normalized)
-        for task in tasks:
-            task_normalized = self._normalize_task_reference(task.title)
+        for task, task_normalized in zip(tasks, titles_normalized, strict=True):
             if task_normalized == reference_normalized:
                 self.store.complete_task(task.id)
                 return self.queries.confirm_task_completed(task)
         
         # Partial match - check if key words overlap
         matches = []
-        ref_words = set(reference_normalized.split())
-        for task in tasks:
-            task_words = set(self._normalize_task_reference(task.title).split())
+        ref_words = _reference_words(reference_normalized)
+        for task, task_normalized in zip(tasks, titles_normalized, strict=True):
+            title_lower = task.title.lower()
             # Match if significant overlap or one contains the other
-            if ref_words & task_words or reference_normalized in task.title.lower() or task.title.lower() in reference_normalized:
+            if (
+                not ref_words.isdisjoint(_reference_words(task_normalized))
+                or reference_normalized in title_lower
+                or title_lower in reference_normalized
+            ):
                 matches.append(task)
         
         if len(matches) == 1:
@@ -236,20 +267,8 @@ class ExecutiveFunctionEngine:
             return self.queries.task_not_found(reference)
     
     def _normalize_task_reference(self, text: str) -> str:
-        """Normalize task reference for matching."""
-        import re
-        text = text.lower().strip()
-        # Remove common verb prefixes (buying -> buy, called -> call)
-        text = re.sub(r'\b(buying|bought)\b', 'buy', text)
-        text = re.sub(r'\b(calling|called)\b', 'call', text)
-        text = re.sub(r'\b(getting|got)\b', 'get', text)
-        text = re.sub(r'\b(making|made)\b', 'make', text)
-        text = re.sub(r'\b(doing|did|done)\b', 'do', text)
-        # Remove articles and common words
-        text = re.sub(r'\b(the|a|an|my|some)\b', '', text)
-        # Collapse whitespace
-        text = ' '.join(text.split())
-        return text
+        """Normalize task reference for matching (memoized per title)."""
+        return _normalize_reference(text)
 
     async def _on_reminder_triggered(self, reminder: Reminder) -> None:
         """Callback when a reminder fires."""
@@ -274,9 +293,11 @@ class ExecutiveFunctionEngine:
         self, message: str, trigger_time: datetime, **kwargs
     ) -> Reminder:
         """Directly add a reminder (bypassing voice parsing)."""
-        return self.store.create_reminder(
+        reminder = self.store.create_reminder(
             message=message, trigger_time=trigger_time, **kwargs
         )
+        self.scheduler.wake()
+        return reminder
 
     def list_tasks(self) -> list[Task]:
         """Get all pending tasks."""
@@ -296,4 +317,12 @@ class ExecutiveFunctionEngine:
 
     def snooze_reminder(self, reminder_id: str, minutes: int = 10) -> Optional[Reminder]:
         """Snooze a reminder."""
-        return self.store.snooze_reminder(reminder_id, minutes)
+        reminder = self.store.snooze_reminder(reminder_id, minutes)
+        self.scheduler.wake()
+        return reminder
+
+    def unsnooze_reminder(self, reminder_id: str) -> Optional[Reminder]:
+        """Return a snoozed reminder to pending."""
+        reminder = self.store.unsnooze_reminder(reminder_id)
+        self.scheduler.wake()
+        return reminder
@@ -16,6 +16,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -97,6 +98,10 @@ class Task(Base):
     Tasks can be standalone or belong to a project.
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Pending/due-today lookups filter on status then due date
+        Index("ix_task_status_due", "status", "due_date"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -114,7 +119,7 @@ class Task(Base):
     
     # Organization
     project_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("projects.id"), nullable=True
+        String(36), ForeignKey("projects.id"), nullable=True, index=True
     )
     context_tags: Mapped[Optional[str]] = mapped_column(
         String(500), nullable=True
@@ -123,7 +128,7 @@ class Task(Base):
     # Source tracking
     source_utterance: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     capture_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("captures.id"), nullable=True
+        String(36), ForeignKey("captures.id"), nullable=True, index=True
     )
     
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -141,8 +146,12 @@ class Task(Base):
     @property
     def is_overdue(self) -> bool:
         """Check if task is past due date."""
+        return self.is_overdue_at(datetime.now())
+
+    def is_overdue_at(self, now: datetime) -> bool:
+        """Check if task is past due date at `now` (share one `now` across loops)."""
         if self.due_date and self.status == TaskStatus.PENDING:
-            return datetime.utcnow() > self.due_date
+            return now > self.due_date
         return False
 
 
@@ -153,6 +162,10 @@ class Reminder(Base):
     Reminders fire at a specific time and can optionally recur.
     """
     __tablename__ = "reminders"
+    __table_args__ = (
+        # The scheduler polls pending reminders by trigger time
+        Index("ix_reminder_status_trigger", "status", "trigger_time"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     message: Mapped[str] = mapped_column(Text, nullable=False)
@@ -201,11 +214,15 @@ class Reminder(Base):
     @property
     def is_due(self) -> bool:
         """Check if reminder should fire now."""
+        return self.is_due_at(datetime.now())
+
+    def is_due_at(self, now: datetime) -> bool:
+        """Check if reminder should fire at `now` (share one `now` across loops)."""
         if self.status != ReminderStatus.PENDING:
             return False
-        if self.snoozed_until and datetime.utcnow() < self.snoozed_until:
+        if self.snoozed_until and now < self.snoozed_until:
             return False
-        return datetime.utcnow() >= self.trigger_time
+        return now >= self.trigger_time
 
 
 class Capture(Base):
@@ -215,6 +232,9 @@ class Capture(Base):
     Captures store the original speech for debugging and reprocessing.
     """
     __tablename__ = "captures"
+    __table_args__ = (
+        Index("ix_capture_processed_timestamp", "processed", "timestamp"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     raw_text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -7,7 +7,7 @@ Returns natural language responses for TTS.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Optional, Sequence
 
 from kiro.efe.models import Task, Reminder, Project, TaskStatus
@@ -18,6 +18,14 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Spoken names, independent of locale and of strftime's platform-specific
+# no-padding flags
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 
 class QueryHandler:
     """
@@ -65,14 +73,8 @@ class QueryHandler:
         E.g., "Superstore" would match "Buy eggs at Superstore" or
         "Buy eggs the next time I go to Superstore"
         """
-        tasks = self.store.get_pending_tasks()
-        context_lower = context.lower()
-        
         # Find tasks matching this context
-        matching = [
-            t for t in tasks
-            if context_lower in t.title.lower()
-        ]
+        matching = self.store.search_pending_tasks(context)
         
         if not matching:
             return f"I don't have anything on your list for {context}."
@@ -97,23 +99,16 @@ class QueryHandler:
         today_end = today_start + timedelta(days=1)
         
         # Get today's tasks (tasks with due date today)
-        all_tasks = self.store.get_pending_tasks()
-        today_tasks = [
-            t for t in all_tasks 
-            if t.due_date and today_start <= t.due_date < today_end
-        ]
+        today_tasks = self.store.get_tasks_due_between(today_start, today_end)
         
         # Get pending reminders for today
-        all_reminders = self.store.get_pending_reminders()
-        today_reminders = [
-            r for r in all_reminders
-            if today_start <= r.trigger_time < today_end
-        ]
+        today_reminders = self.store.get_reminders_between(today_start, today_end)
         
         # No items today
         if not today_tasks and not today_reminders:
-            if all_tasks:
-                return f"Nothing scheduled for today specifically, but you have {len(all_tasks)} tasks on your list."
+            task_count = self.store.count_pending_tasks()
+            if task_count:
+                return f"Nothing scheduled for today specifically, but you have {task_count} tasks on your list."
             return "You have nothing scheduled for today. Your day is clear!"
         
         parts = []
@@ -132,7 +127,7 @@ class QueryHandler:
         if today_reminders:
             if len(today_reminders) == 1:
                 r = today_reminders[0]
-                time_str = r.trigger_time.strftime("%-I:%M %p")
+                time_str = self._format_clock(r.trigger_time)
                 parts.append(f"one reminder at {time_str}: {r.message}")
             else:
                 parts.append(f"{len(today_reminders)} reminders scheduled")
@@ -176,14 +171,14 @@ class QueryHandler:
             parts.append(f"Next step: {project.next_step}")
         
         # Count tasks
-        tasks = self.store.get_all_tasks(project_id=project.id)
-        pending = [t for t in tasks if t.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)]
-        completed = [t for t in tasks if t.status == TaskStatus.COMPLETED]
+        counts = self.store.count_tasks_by_status(project.id)
+        pending = counts.get(TaskStatus.PENDING, 0) + counts.get(TaskStatus.IN_PROGRESS, 0)
+        completed = counts.get(TaskStatus.COMPLETED, 0)
         
         if pending:
-            parts.append(f"{len(pending)} tasks remaining")
+            parts.append(f"{pending} tasks remaining")
         if completed:
-            parts.append(f"{len(completed)} completed")
+            parts.append(f"{completed} completed")
         
         return ". ".join(parts) + "."
 
@@ -259,37 +254,40 @@ class QueryHandler:
     def _format_reminder_time(self, dt: datetime) -> str:
         """Format reminder time naturally."""
         now = datetime.now()
-        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
+        days_away = (dt.date() - now.date()).days
         
-        time_str = dt.strftime("%-I:%M %p").lower()
+        time_str = self._format_clock(dt).lower()
         
-        if dt.date() == now.date():
+        if days_away == 0:
             # Check if it's soon
             minutes_away = (dt - now).total_seconds() / 60
             if minutes_away < 60:
                 return f"in about {int(minutes_away)} minutes"
             return f"today at {time_str}"
-        elif dt.date() == tomorrow.date():
+        elif days_away == 1:
             return f"tomorrow at {time_str}"
-        elif dt < today + timedelta(days=7):
-            day_name = dt.strftime("%A")
+        elif days_away < 7:
+            day_name = _WEEKDAYS[dt.weekday()]
             return f"on {day_name} at {time_str}"
         else:
-            date_str = dt.strftime("%B %-d")
+            date_str = f"{_MONTHS[dt.month - 1]} {dt.day}"
             return f"on {date_str} at {time_str}"
 
+    def _format_clock(self, dt: datetime) -> str:
+        """Format a time of day like "3:05 PM"."""
+        hour = (dt.hour - 1) % 12 + 1
+        ampm = "AM" if dt.hour < 12 else "PM"
+        return f"{hour}:{dt.minute:02d} {ampm}"
+
     def _format_due_date(self, dt: datetime) -> str:
         """Format due date naturally."""
-        now = datetime.now()
-        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
+        days_away = (dt.date() - date.today()).days
         
-        if dt.date() == now.date():
+        if days_away == 0:
             return "today"
-        elif dt.date() == tomorrow.date():
+        elif days_away == 1:
             return "tomorrow"
-        elif dt < today + timedelta(days=7):
-            return dt.strftime("%A")
+        elif days_away < 7:
+            return _WEEKDAYS[dt.weekday()]
         else:
-            return dt.strftime("%B %-d")
+            return f"{_MONTHS[dt.month - 1]} {dt.day}"
@@ -7,8 +7,9 @@ Background scheduler that checks for due reminders and triggers them.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Callable, Optional, Awaitable
+from typing import TYPE_CHECKING, Any, Callable, Optional, Awaitable
 
 from kiro.efe.models import Reminder, ReminderStatus, RecurrenceType
 from kiro.utils.logging import get_logger
@@ -23,9 +24,15 @@ class ReminderScheduler:
     """
     Background scheduler for reminder triggering.
     
-    Periodically checks for due reminders and fires them via callback.
+    Sleeps until the next pending reminder is due, woken early by wake()
+    when reminders change, and checks at least every check_interval so
+    writes made without a wake() (other processes, direct store use) are
+    still picked up. Due reminders fire via callback.
     """
 
+    # Seconds to wait before retrying after a failed check
+    RETRY_DELAY = 30.0
+
     def __init__(
         self,
         store: "EFEStore",
@@ -38,7 +45,7 @@ class ReminderScheduler:
         Args:
             store: The EFE database store
             on_reminder: Async callback when a reminder fires
-            check_interval: Seconds between reminder checks
+            check_interval: Longest time to sleep between reminder checks
         """
         self.store = store
         self.on_reminder = on_reminder
@@ -46,6 +53,11 @@ class ReminderScheduler:
         
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def wake(self) -> None:
+        """Recompute the sleep after reminders were added or changed."""
+        self._wakeup.set()
 
     async def start(self) -> None:
         """Start the scheduler background task."""
@@ -55,7 +67,7 @@ class ReminderScheduler:
         
         self._running = True
         self._task = asyncio.create_task(self._run_loop())
-        logger.info(f"Reminder scheduler started (interval: {self.check_interval}s)")
+        logger.info(f"Reminder scheduler started (max interval: {self.check_interval}s)")
 
     async def stop(self) -> None:
         """Stop the scheduler."""
@@ -72,36 +84,59 @@ class ReminderScheduler:
     async def _run_loop(self) -> None:
         """Main scheduler loop."""
         while self._running:
+            # Cleared before checking so a wake() during the check isn't lost
+            self._wakeup.clear()
             try:
                 await self._check_reminders()
+                delay = self._seconds_until_next()
             except Exception as e:
                 logger.error(f"Error checking reminders: {e}")
+                delay = self.RETRY_DELAY
             
-            await asyncio.sleep(self.check_interval)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+
+    def _seconds_until_next(self) -> float:
+        """Seconds to sleep before the next reminder is due."""
+        next_time = self.store.get_next_trigger_time()
+        if next_time is None:
+            return self.check_interval
+        delay = (next_time - datetime.now()).total_seconds()
+        # Floor keeps a reminder that's due but not returned from spinning
+        return min(max(delay, 1.0), self.check_interval)
 
     async def _check_reminders(self) -> None:
         """Check for and fire due reminders."""
         due_reminders = self.store.get_due_reminders()
+        if not due_reminders:
+            return
+
+        # Mark the batch as triggered and queue follow-ups for recurring
+        # reminders in one commit, before any callback runs
+        next_occurrences = []
+        for reminder in due_reminders:
+            if reminder.recurrence != RecurrenceType.NONE:
+                occurrence = self._next_occurrence(reminder)
+                if occurrence:
+                    next_occurrences.append(occurrence)
+        self.store.trigger_reminders(
+            [reminder.id for reminder in due_reminders], next_occurrences
+        )
+        for occurrence in next_occurrences:
+            logger.info(f"Scheduled next occurrence at {occurrence['trigger_time']}")
         
         for reminder in due_reminders:
             logger.info(f"Firing reminder: {reminder.message}")
             
-            # Mark as triggered
-            self.store.trigger_reminder(reminder.id)
-            
             # Fire callback
             if self.on_reminder:
                 try:
                     await self.on_reminder(reminder)
                 except Exception as e:
                     logger.error(f"Error in reminder callback: {e}")
-            
-            # Handle recurrence
-            if reminder.recurrence != RecurrenceType.NONE:
-                await self._schedule_next_occurrence(reminder)
 
-    async def _schedule_next_occurrence(self, reminder: Reminder) -> None:
-        """Create next occurrence for recurring reminder."""
+    def _next_occurrence(self, reminder: Reminder) -> Optional[dict[str, Any]]:
+        """Column values for the next occurrence of a recurring reminder."""
         next_time = self._calculate_next_time(
             reminder.trigger_time, reminder.recurrence
         )
@@ -109,16 +144,15 @@ class ReminderScheduler:
         # Check if past recurrence end
         if reminder.recurrence_end and next_time > reminder.recurrence_end:
             logger.debug(f"Recurring reminder {reminder.id} past end date")
-            return
+            return None
         
-        # Create new reminder
-        self.store.create_reminder(
-            message=reminder.message,
-            trigger_time=next_time,
-            recurrence=reminder.recurrence.value,
-            source_utterance=reminder.source_utterance,
-        )
-        logger.info(f"Scheduled next occurrence at {next_time}")
+        return {
+            "message": reminder.message,
+            "trigger_time": next_time,
+            "recurrence": reminder.recurrence,
+            "recurrence_end": reminder.recurrence_end,
+            "source_utterance": reminder.source_utterance,
+        }
 
     def _calculate_next_time(
         self, current_time: datetime, recurrence: RecurrenceType
@@ -146,10 +180,10 @@ class ReminderScheduler:
         """
         due = self.store.get_due_reminders()
         count = len(due)
+        self.store.trigger_reminders([reminder.id for reminder in due])
         
         for reminder in due:
             logger.info(f"Manual trigger: {reminder.message}")
-            self.store.trigger_reminder(reminder.id)
             
             if self.on_reminder:
                 try:
@@ -161,14 +195,14 @@ class ReminderScheduler:
 
     def get_next_reminder(self) -> Optional[Reminder]:
         """Get the next upcoming reminder."""
-        reminders = self.store.get_pending_reminders()
+        reminders = self.store.get_pending_reminders(limit=1)
         if reminders:
-            return reminders[0]  # Already ordered by trigger_time
+            return reminders[0]
         return None
 
     def time_until_next(self) -> Optional[timedelta]:
         """Get time until next reminder."""
-        next_reminder = self.get_next_reminder()
-        if next_reminder:
-            return next_reminder.trigger_time - datetime.now()
+        next_time = self.store.get_next_trigger_time()
+        if next_time:
+            return next_time - datetime.now()
         return None
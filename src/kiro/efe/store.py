@@ -9,9 +9,9 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import create_engine, select, update
+from sqlalchemy import create_engine, func, insert, or_, select, update
 from sqlalchemy.orm import Session, sessionmaker
 
 from kiro.efe.models import (
@@ -25,6 +25,9 @@ from kiro.efe.models import (
     TaskStatus,
 )
 
+# Statuses that count as still on the user's list
+_OPEN_TASK_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
 
 class EFEStore:
     """
@@ -51,6 +54,18 @@ class EFEStore:
         
         # Create tables if they don't exist
         Base.metadata.create_all(self.engine)
+        self._create_missing_indexes()
+
+    def _create_missing_indexes(self) -> None:
+        """
+        Add indexes declared on the models to an existing database.
+
+        create_all only emits indexes for tables it creates, so databases
+        made before an index was added would otherwise never get it.
+        """
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
 
     def _get_session(self) -> Session:
         """Get a new database session."""
@@ -106,9 +121,7 @@ class EFEStore:
             if status:
                 query = query.where(Task.status == status)
             elif not include_completed:
-                query = query.where(
-                    Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS])
-                )
+                query = query.where(Task.status.in_(_OPEN_TASK_STATUSES))
             
             if project_id:
                 query = query.where(Task.project_id == project_id)
@@ -120,6 +133,41 @@ class EFEStore:
         """Get all pending (not completed/cancelled) tasks."""
         return self.get_all_tasks(include_completed=False)
 
+    def count_pending_tasks(self) -> int:
+        """Count pending tasks without loading them."""
+        with self._get_session() as session:
+            query = select(func.count()).select_from(Task).where(
+                Task.status.in_(_OPEN_TASK_STATUSES)
+            )
+            return session.execute(query).scalar_one()
+
+    def count_tasks_by_status(self, project_id: str) -> dict[TaskStatus, int]:
+        """Count a project's tasks per status without loading them."""
+        with self._get_session() as session:
+            query = select(Task.status, func.count()).where(
+                Task.project_id == project_id
+            ).group_by(Task.status)
+            return dict(session.execute(query).all())
+
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+        """Get pending tasks due in [start, end)."""
+        with self._get_session() as session:
+            query = select(Task).where(
+                Task.status.in_(_OPEN_TASK_STATUSES),
+                Task.due_date >= start,
+                Task.due_date < end,
+            ).order_by(Task.created_at.desc())
+            return session.scalars(query).all()
+
+    def search_pending_tasks(self, text: str) -> Sequence[Task]:
+        """Get pending tasks whose title contains text (case-insensitive)."""
+        with self._get_session() as session:
+            query = select(Task).where(
+                Task.status.in_(_OPEN_TASK_STATUSES),
+                Task.title.icontains(text, autoescape=True),
+            ).order_by(Task.created_at.desc())
+            return session.scalars(query).all()
+
     def complete_task(self, task_id: str) -> Optional[Task]:
         """Mark a task as completed."""
         with self._get_session() as session:
@@ -138,7 +186,7 @@ class EFEStore:
             if task:
                 task.status = status
                 if status == TaskStatus.COMPLETED:
-                    task.completed_at = datetime.utcnow()
+                    task.completed_at = datetime.now()
                 session.commit()
                 session.refresh(task)
             return task
@@ -188,14 +236,32 @@ class EFEStore:
         with self._get_session() as session:
             return session.get(Reminder, reminder_id)
 
-    def get_pending_reminders(self) -> Sequence[Reminder]:
-        """Get all pending reminders."""
+    def get_pending_reminders(self, limit: Optional[int] = None) -> Sequence[Reminder]:
+        """Get pending reminders, soonest first (optionally only the first `limit`)."""
         with self._get_session() as session:
             query = select(Reminder).where(
                 Reminder.status == ReminderStatus.PENDING
+            ).order_by(Reminder.trigger_time).limit(limit)
+            return session.scalars(query).all()
+
+    def get_reminders_between(self, start: datetime, end: datetime) -> Sequence[Reminder]:
+        """Get pending reminders set to trigger in [start, end)."""
+        with self._get_session() as session:
+            query = select(Reminder).where(
+                Reminder.status == ReminderStatus.PENDING,
+                Reminder.trigger_time >= start,
+                Reminder.trigger_time < end,
             ).order_by(Reminder.trigger_time)
             return session.scalars(query).all()
 
+    def get_next_trigger_time(self) -> Optional[datetime]:
+        """Get the earliest trigger time among pending reminders."""
+        with self._get_session() as session:
+            query = select(func.min(Reminder.trigger_time)).where(
+                Reminder.status == ReminderStatus.PENDING
+            )
+            return session.scalar(query)
+
     def get_due_reminders(self) -> Sequence[Reminder]:
         """Get reminders that should fire now."""
         now = datetime.now()
@@ -203,13 +269,10 @@ class EFEStore:
             query = select(Reminder).where(
                 Reminder.status == ReminderStatus.PENDING,
                 Reminder.trigger_time <= now,
+                # Skip snoozed reminders
+                or_(Reminder.snoozed_until.is_(None), Reminder.snoozed_until <= now),
             )
-            # Filter snoozed reminders
-            results = []
-            for reminder in session.scalars(query).all():
-                if reminder.snoozed_until is None or now >= reminder.snoozed_until:
-                    results.append(reminder)
-            return results
+            return session.scalars(query).all()
 
     def trigger_reminder(self, reminder_id: str) -> Optional[Reminder]:
         """Mark a reminder as triggered."""
@@ -222,6 +285,30 @@ class EFEStore:
                 session.refresh(reminder)
             return reminder
 
+    def trigger_reminders(
+        self,
+        reminder_ids: Sequence[str],
+        next_occurrences: Sequence[dict[str, Any]] = (),
+    ) -> None:
+        """
+        Mark reminders as triggered in one statement.
+
+        Args:
+            reminder_ids: Reminders that fired
+            next_occurrences: Column values for follow-up reminders of
+                recurring ones, inserted in the same commit
+        """
+        with self._get_session() as session:
+            if reminder_ids:
+                session.execute(
+                    update(Reminder)
+                    .where(Reminder.id.in_(reminder_ids))
+                    .values(status=ReminderStatus.TRIGGERED, triggered_at=datetime.now())
+                )
+            if next_occurrences:
+                session.execute(insert(Reminder), list(next_occurrences))
+            session.commit()
+
     def acknowledge_reminder(self, reminder_id: str) -> Optional[Reminder]:
         """Mark a reminder as acknowledged."""
         with self._get_session() as session:
@@ -341,6 +428,66 @@ class EFEStore:
             session.refresh(capture)
             return capture
 
+    def create_capture_and_task(
+        self,
+        raw_text: str,
+        title: str,
+        confidence: Optional[float] = None,
+    ) -> Task:
+        """Record a processed capture and the task made from it in one commit."""
+        with self._get_session() as session:
+            capture = self._processed_capture(session, raw_text, "task", confidence)
+            task = Task(
+                title=title,
+                source_utterance=raw_text,
+                capture_id=capture.id,
+            )
+            session.add(task)
+            session.commit()
+            session.refresh(task)
+            return task
+
+    def create_capture_and_reminder(
+        self,
+        raw_text: str,
+        message: str,
+        trigger_time: datetime,
+        confidence: Optional[float] = None,
+    ) -> Reminder:
+        """Record a processed capture and the reminder made from it in one commit."""
+        with self._get_session() as session:
+            capture = self._processed_capture(session, raw_text, "reminder", confidence)
+            reminder = Reminder(
+                message=message,
+                trigger_time=trigger_time,
+                source_utterance=raw_text,
+                capture_id=capture.id,
+            )
+            session.add(reminder)
+            session.commit()
+            session.refresh(reminder)
+            return reminder
+
+    def _processed_capture(
+        self,
+        session: Session,
+        raw_text: str,
+        intent: str,
+        confidence: Optional[float],
+    ) -> Capture:
+        """Add a capture already converted to `intent` and flush for its id."""
+        capture = Capture(
+            raw_text=raw_text,
+            detected_intent=intent,
+            confidence=confidence,
+            processed=True,
+            processed_at=datetime.now(),
+            converted_to=intent,
+        )
+        session.add(capture)
+        session.flush()
+        return capture
+
     def mark_capture_processed(
         self,
         capture_id: str,
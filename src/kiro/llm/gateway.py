@@ -26,7 +26,7 @@ class Role(str, Enum):
     ASSISTANT = "assistant"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A single message in a conversation."""
     role: Role
@@ -38,7 +38,7 @@ class Message:
         return {"role": self.role.value, "content": self.content}
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from an LLM provider."""
     content: str
@@ -92,6 +92,7 @@ class LLMGateway:
     - Automatic fallback on errors
     - Request/response logging
     - Retry with exponential backoff
+    - Coalescing of identical concurrent requests
     """
 
     def __init__(
@@ -120,6 +121,13 @@ class LLMGateway:
 
         self._running = False
 
+        # In-flight requests by content; identical concurrent requests (e.g.
+        # the same utterance arriving twice) share one provider call
+        self._inflight: dict[tuple[object, ...], asyncio.Task[LLMResponse]] = {}
+        # Callers still waiting on each in-flight task; the task is
+        # cancelled when the last one leaves
+        self._waiters: dict[asyncio.Task[LLMResponse], int] = {}
+
     async def start(self) -> None:
         """Start the gateway."""
         self._running = True
@@ -131,8 +139,44 @@ class LLMGateway:
     async def stop(self) -> None:
         """Stop the gateway."""
         self._running = False
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         logger.info("llm_gateway_stopped")
 
+    async def warm_up(self, system_prompt: str | None = None, timeout: float = 5.0) -> None:
+        """
+        Send a one-token request to the primary provider.
+
+        Opens the provider's HTTP connection (TLS handshake included) ahead
+        of the first real request; sending the real system prompt also
+        lets providers with prompt caching cache it. Failures are only
+        logged, since the first real request simply pays the cost instead.
+        """
+        try:
+            response = await asyncio.wait_for(
+                self.primary.generate(
+                    messages=[Message(role=Role.USER, content="ping")],
+                    system_prompt=system_prompt,
+                    max_tokens=1,
+                    temperature=0.0,
+                ),
+                timeout=timeout,
+            )
+        except Exception as e:
+            logger.debug("llm_warm_up_failed", provider=self.primary.name, error=str(e))
+            return
+
+        if response.error:
+            logger.debug("llm_warm_up_failed", provider=self.primary.name, error=response.error)
+        else:
+            logger.debug(
+                "llm_warmed_up",
+                provider=self.primary.name,
+                latency_ms=round(response.latency_ms, 1),
+            )
+
     async def generate(
         self,
         messages: list[Message],
@@ -144,7 +188,9 @@ class LLMGateway:
         """
         Generate a response from the LLM.
 
-        Tries primary provider first, falls back on failure.
+        Tries primary provider first, falls back on failure. A request
+        identical to one already in flight waits for that one's response
+        instead of making its own call.
         """
         if not self._running:
             return LLMResponse(
@@ -154,6 +200,53 @@ class LLMGateway:
                 error="LLM gateway not running",
             )
 
+        key = (
+            tuple((m.role, m.content) for m in messages),
+            system_prompt,
+            max_tokens,
+            temperature,
+            tuple(stop_sequences) if stop_sequences else None,
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._generate(messages, system_prompt, max_tokens, temperature, stop_sequences)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        else:
+            logger.debug("llm_request_coalesced", message_count=len(messages))
+
+        # Shielded so one caller giving up doesn't cancel it for the others
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    # Last caller gave up (timeout, barge-in): stop the
+                    # request, and don't let a new caller join it meanwhile
+                    self._forget_inflight(key, task)
+                    task.cancel()
+
+    def _forget_inflight(
+        self, key: tuple[object, ...], task: asyncio.Task[LLMResponse]
+    ) -> None:
+        """Drop a request from the in-flight map if it is still the one there."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _generate(
+        self,
+        messages: list[Message],
+        system_prompt: str | None,
+        max_tokens: int,
+        temperature: float,
+        stop_sequences: list[str] | None,
+    ) -> LLMResponse:
+        """Run one request against the primary, then fallback, provider."""
         logger.debug(
             "llm_request",
             message_count=len(messages),
@@ -0,0 +1,71 @@
+"""
+Kiro Path Cache
+
+Small on-disk JSON cache for filesystem discovery results (executables,
+model files) so cold starts don't re-scan every candidate location.
+Entries are only trusted if the cached path still exists, and the whole
+file is discarded when the Kiro version changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from kiro import __version__
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "kiro"
+
+
+class PathCache:
+    """
+    JSON-backed mapping of lookup keys to discovered paths.
+
+    The file is read lazily on first access and rewritten on every change;
+    I/O errors are ignored, since a missing cache only means a re-scan.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache file (default: ~/.cache/kiro/paths.json)
+        """
+        self.path = path or CACHE_DIR / "paths.json"
+        self._entries: dict[str, str] | None = None
+
+    def _load(self) -> dict[str, str]:
+        """Read the cache file, dropping it if written by another version."""
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get("version") == __version__:
+                    self._entries = dict(data.get("paths", {}))
+            except (OSError, ValueError, AttributeError):
+                pass
+            if self._entries is None:
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> str | None:
+        """Get a cached path, or None if unknown or no longer present."""
+        value = self._load().get(key)
+        if value is not None and Path(value).exists():
+            return value
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Remember a discovered path."""
+        entries = self._load()
+        if entries.get(key) == value:
+            return
+        entries[key] = value
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": __version__, "paths": entries}))
+            tmp.replace(self.path)
+        except OSError:
+            pass
@@ -108,5 +108,20 @@ def get_logger(name: str | None = None) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+def debug_enabled(logger: Any) -> bool:
+    """
+    Check whether debug events from a logger would be emitted.
+
+    Lets hot paths skip building debug-only values once logging is set up.
+
+    Args:
+        logger: A structlog logger (needs structlog's is_enabled_for, 25.1+)
+
+    Returns:
+        True if the logger's level lets DEBUG events through
+    """
+    return bool(logger.is_enabled_for(logging.DEBUG))
+
+
 # Convenience: pre-bound logger for quick imports
 logger = structlog.get_logger()
@@ -82,6 +82,8 @@ class VoicePipeline:
             audio_device=self.config.audio.input_device,
             wake_word_threshold=self.config.audio.wake_word.threshold,
             wake_word_refractory=self.config.audio.wake_word.refractory_period,
+            wake_word_batch_size=self.config.audio.wake_word.batch_size,
+            wake_word_quantize=self.config.audio.wake_word.quantize,
             vad_aggressiveness=self.config.audio.vad.aggressiveness,
             vad_min_speech=self.config.audio.vad.min_speech_duration,
             vad_max_silence=self.config.audio.vad.max_silence_duration,
@@ -91,6 +93,7 @@ class VoicePipeline:
             stt_language=self.config.audio.stt.language,
             stt_device=self.config.audio.stt.device,
             stt_compute_type=self.config.audio.stt.compute_type,
+            stt_batch_size=self.config.audio.stt.batch_size,
             openai_api_key=self._openai_key,
         )
 
@@ -64,6 +64,49 @@ class TestAudioCapture:
         result = await capture.get_chunk(timeout=0.1)
         assert result is None
 
+    @pytest.fixture
+    async def capture(self):
+        """Started capture with no real input stream behind it."""
+        capture = AudioCapture(sample_rate=1000, chunk_duration=0.1)
+        with patch("kiro.audio.capture.sd.InputStream"), \
+                patch("kiro.audio.capture._device_info", return_value={"name": "fake"}):
+            await capture.start()
+        yield capture
+        await capture.stop()
+
+    @pytest.mark.asyncio
+    async def test_odd_sized_blocks_are_reblocked(self, capture):
+        audio = np.arange(1000, dtype=np.float32)
+        pos = 0
+        for size in (7, 93, 250, 1, 149, 300, 200):
+            capture._audio_callback(audio[pos:pos + size, None], size, {}, None)
+            pos += size
+
+        chunks = [(await capture.get_chunk(timeout=1)).copy() for _ in range(10)]
+        np.testing.assert_array_equal(np.concatenate(chunks), audio)
+        assert await capture.get_chunk(timeout=0.01) is None
+        assert capture.stream_time == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_backlog_overflow_drops_oldest_chunks(self, capture):
+        from structlog.testing import capture_logs
+
+        chunk_size = capture.chunk_size
+        total = capture.MAX_BACKLOG + 10
+        for i in range(total):
+            block = np.full((chunk_size, 1), i, dtype=np.float32)
+            capture._audio_callback(block, chunk_size, {}, None)
+
+        with capture_logs() as logs:
+            chunk = await capture.get_chunk(timeout=1)
+
+        # Resumes on recent audio instead of working through the backlog
+        dropped = total - capture.MAX_BACKLOG // 2
+        assert capture.dropped_frames == dropped
+        assert chunk[0] == dropped
+        assert [log["event"] for log in logs] == ["audio_frames_dropped"]
+        assert logs[0]["dropped"] == dropped
+
 
 class TestVoiceActivityDetector:
     """Tests for VAD module."""
@@ -116,6 +159,488 @@ class TestVoiceActivityDetector:
 
         await vad.stop()
 
+    @pytest.mark.asyncio
+    async def test_speech_onset_not_delayed_by_batching(self):
+        """Speech triggers and ends on the same chunk as per-chunk VAD did."""
+        vad = VoiceActivityDetector(min_speech_duration=0.25, max_silence_duration=0.8)
+        await vad.start()
+        speaking = True
+        vad._vad = MagicMock()
+        vad._vad.is_speech.side_effect = lambda frame, rate: speaking
+
+        # Four 100 ms chunks of speech ("yes"), then silence
+        chunk = np.full(1600, 0.1, dtype=np.float32)
+        onset = end = None
+        for k in range(1, 30):
+            speaking = k <= 4
+            result = vad.process(chunk, t=k * 0.1)
+            if result["is_speaking"] and onset is None:
+                onset = k
+            if result["end_of_speech"]:
+                end = k
+                break
+
+        assert onset == 4
+        assert end == 12
+        await vad.stop()
+
+    @pytest.mark.asyncio
+    async def test_gated_chunks_flush_pending_batch(self):
+        """Loud audio left pending before a gated chunk is neither lost nor misdated."""
+        vad = VoiceActivityDetector(min_speech_duration=0.25, max_silence_duration=0.8)
+        await vad.start()
+        vad._vad = MagicMock()
+        vad._vad.is_speech.side_effect = lambda frame, rate: any(bytes(frame))
+
+        # A lone loud chunk, a gap the energy gate skips, then 0.5-0.9s of speech
+        chunk = np.full(1600, 0.1, dtype=np.float32)
+        loud = {1, 6, 7, 8, 9}
+        onset = end = None
+        for k in range(1, 30):
+            t = k * 0.1
+            result = vad.process(chunk, t=t) if k in loud else vad.mark_silence(t=t)
+            if result["is_speaking"] and onset is None:
+                onset = k
+            if result["end_of_speech"]:
+                end = k
+                break
+
+        assert onset == 9
+        assert end == 17
+        await vad.stop()
+
+
+class TestSpeechToText:
+    """Tests for STT helpers that don't need a model."""
+
+    def test_audio_to_wav_matches_wave_module(self):
+        import io
+        import wave
+
+        from kiro.audio.stt import SpeechToText
+
+        stt = SpeechToText(sample_rate=16000)
+        audio = np.linspace(-1.0, 1.0, 1600, dtype=np.float32)
+
+        expected = io.BytesIO()
+        with wave.open(expected, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+        assert stt._audio_to_wav(audio) == expected.getvalue()
+
+    def test_wav_stream_matches_audio_to_wav(self):
+        from kiro.audio.stt import SpeechToText, _WavStream
+
+        stt = SpeechToText(sample_rate=16000)
+        audio = np.linspace(-1.0, 1.0, 1601, dtype=np.float32)
+        expected = bytes(stt._audio_to_wav(audio))
+
+        # Odd read sizes split the header and individual samples
+        stream = _WavStream(audio, 16000)
+        parts = []
+        while part := stream.read(7):
+            parts.append(part)
+        assert b"".join(parts) == expected
+        assert stream.tell() == len(expected)
+
+        # Seeking back into the middle of a sample resumes mid-sample
+        stream.seek(101)
+        assert stream.read() == expected[101:]
+        assert stream.seek(0, 2) == len(expected)
+
+    def test_buffer_stream_reads_without_copying(self):
+        from kiro.audio.stt import _BufferStream
+
+        buffer = bytearray(range(256)) * 4
+        stream = _BufferStream(buffer)
+
+        assert stream.read(7) == bytes(buffer[:7])
+        buffer[7] = 0  # A view, not a snapshot
+        assert stream.read(5) == bytes(buffer[7:12])
+        assert stream.read() == bytes(buffer[12:])
+        assert stream.read(1) == b""
+
+        stream.seek(-3, 2)
+        assert stream.read() == bytes(buffer[-3:])
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_queued_request(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from kiro.audio.stt import SpeechToText
+
+        stt = SpeechToText(engine="faster-whisper")
+        stt._engine = "faster-whisper"
+        stt._loop = asyncio.get_running_loop()
+        stt._executor = ThreadPoolExecutor(max_workers=1)
+        stt._running = True
+
+        # First clip holds the STT thread until released
+        dispatched = threading.Event()
+        release = threading.Event()
+
+        def run_faster_whisper(audio):
+            dispatched.set()
+            release.wait(5)
+            return "late", 1.0
+
+        stt._run_faster_whisper = run_faster_whisper
+
+        in_flight = asyncio.create_task(stt.transcribe(np.zeros(1600, dtype=np.float32)))
+        await asyncio.get_running_loop().run_in_executor(None, dispatched.wait, 5)
+        queued = asyncio.create_task(stt.transcribe(np.zeros(1600, dtype=np.float32)))
+        await asyncio.sleep(0)
+
+        await stt.stop()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(queued, timeout=1)
+        assert (await asyncio.wait_for(in_flight, timeout=1))["text"] == "late"
+
+    @pytest.mark.asyncio
+    async def test_requests_resolve_in_arrival_order(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from kiro.audio.stt import SpeechToText
+
+        stt = SpeechToText(engine="faster-whisper")
+        stt._engine = "faster-whisper"
+        stt._loop = asyncio.get_running_loop()
+        stt._executor = ThreadPoolExecutor(max_workers=1)
+        stt._running = True
+
+        # Second clip blocks until released; the first must not wait on it
+        calls = []
+        release = threading.Event()
+
+        def run_faster_whisper(audio):
+            calls.append(len(audio))
+            if len(calls) == 2:
+                release.wait(5)
+            return f"clip{len(calls)}", 1.0
+
+        stt._run_faster_whisper = run_faster_whisper
+
+        long_clip = asyncio.create_task(stt.transcribe(np.zeros(3200, dtype=np.float32)))
+        short_clip = asyncio.create_task(stt.transcribe(np.zeros(1600, dtype=np.float32)))
+
+        first = await asyncio.wait_for(long_clip, timeout=1)
+        assert first["text"] == "clip1"
+        assert not short_clip.done()
+
+        release.set()
+        second = await asyncio.wait_for(short_clip, timeout=1)
+        assert second["text"] == "clip2"
+        assert calls == [3200, 1600]
+        await stt.stop()
+
+
+class TestKernels:
+    """Tests for shared sample conversions."""
+
+    def test_float_to_int16_saturates(self):
+        from kiro.audio._kernels import float_to_int16
+
+        src = np.array([-1.5, -1.0, 0.0, 0.5, 1.0, 2.0], dtype=np.float32)
+        dst = np.empty(src.size, dtype=np.int16)
+        float_to_int16(src, dst, np.empty_like(src))
+
+        assert dst.tolist() == [-32767, -32767, 0, 16383, 32767, 32767]
+        assert src[0] == -1.5  # Input untouched when scratch is separate
+
+
+class TestWakeWordDetector:
+    """Tests for wake word batching with a stub model."""
+
+    def test_batches_chunks_per_predict(self):
+        from kiro.audio.wake_word import WakeWordDetector
+
+        detector = WakeWordDetector(batch_size=4)
+        detector._model = MagicMock()
+        detector._model.predict.return_value = {"hey_jarvis": 0.0}
+        detector._running = True
+
+        chunks = [np.full(1600, i / 10, dtype=np.float32) for i in range(8)]
+        for chunk in chunks:
+            detector.process(chunk)
+
+        calls = detector._model.predict.call_args_list
+        assert len(calls) == 2
+        first = calls[0].args[0]
+        assert first.dtype == np.int16 and first.size == 4 * 1600
+        assert first[1600] == int(0.1 * 32767)
+
+
+class FakePiperProcess:
+    """Stand-in for a Piper subprocess that emits the given PCM chunks."""
+
+    def __init__(self, chunks=()):
+        self.returncode = None
+        self.killed = False
+        self.stdin = MagicMock()
+        self.stdin.drain = AsyncMock()
+        self.stdout = asyncio.StreamReader()
+        self.stderr = asyncio.StreamReader()
+        self._exited = asyncio.Event()
+        for chunk in chunks:
+            self.stdout.feed_data(chunk)
+
+    def finish(self):
+        """End synthesis: EOF on stdout and a clean exit."""
+        self.stdout.feed_eof()
+        self.stderr.feed_eof()
+        self.returncode = 0
+        self._exited.set()
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+        self.stdout.feed_eof()
+        self._exited.set()
+
+    async def wait(self):
+        await self._exited.wait()
+        return self.returncode
+
+
+async def wait_until(condition, steps=1000):
+    """Yield to the event loop until condition() holds."""
+    for _ in range(steps):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+class TestTextToSpeech:
+    """Tests for TTS playback and Piper streaming with fake I/O."""
+
+    @pytest.fixture
+    async def tts(self, tmp_path, monkeypatch):
+        """Running Piper TTS with a fake output stream and fake processes."""
+        from kiro.audio.tts import TextToSpeech
+
+        monkeypatch.setattr("kiro.utils.cache.CACHE_DIR", tmp_path)
+        tts = TextToSpeech()
+        tts.piper_path = "piper"
+        tts.piper_model = "voice.onnx"
+        tts._engine = "piper"
+        tts._running = True
+        tts._loop = asyncio.get_running_loop()
+        tts._output_stream = MagicMock()
+
+        tts.spawned = []
+
+        async def spawn_piper():
+            await asyncio.sleep(0)  # Let overlapping spawns interleave
+            proc = FakePiperProcess([b"\x01\x00" * 512])
+            tts.spawned.append(proc)
+            return proc
+
+        tts._spawn_piper = spawn_piper
+        return tts
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_playback_starts_kills_piper(self, tts):
+        # No await between speak() creating the task and the cancel, so the
+        # playback task never takes its first step
+        assert await tts.speak("hello")
+        await tts.cancel_playback()
+
+        first = tts.spawned[0]
+        assert first.killed
+        assert tts._piper_proc is tts.spawned[1]  # Next standby prespawned
+        assert not tts._play_queue
+
+    @pytest.mark.asyncio
+    async def test_playback_drains_queue_and_completes(self, tts):
+        completed = asyncio.Event()
+        assert await tts.speak("hello", on_complete=completed.set)
+        proc = tts.spawned[0]
+        proc.stdout.feed_data(b"\x02\x00" * 1000)
+        proc.finish()
+        await wait_until(lambda: tts._play_done is not None)
+
+        # Drive the PortAudio callback until playback reports completion
+        block = bytearray(tts.OUTPUT_BLOCKSIZE * 2)
+        played = bytearray()
+        while not completed.is_set():
+            assert len(played) < 4 * len(block)
+            tts._output_callback(block, tts.OUTPUT_BLOCKSIZE, None, None)
+            played += block
+            await asyncio.sleep(0)
+        await tts._current_playback
+
+        expected = b"\x01\x00" * 512 + b"\x02\x00" * 1000
+        assert played[:len(expected)] == expected
+        assert not any(played[len(expected):])  # Padded with silence
+        assert not tts._play_queue
+        assert not proc.killed  # Exited on its own, then reaped
+        assert tts._piper_proc is tts.spawned[1]
+
+    @pytest.mark.asyncio
+    async def test_cancel_mid_stream_stops_playback_and_kills_piper(self, tts):
+        completed = asyncio.Event()
+        assert await tts.speak("hello", on_complete=completed.set)
+        await wait_until(lambda: tts._play_queue)
+
+        # Piper is still synthesizing when playback is cancelled
+        await tts.cancel_playback()
+
+        assert not tts._play_queue
+        assert tts._play_done is None
+        assert tts.spawned[0].killed
+        assert tts._piper_proc is tts.spawned[1]
+
+        block = bytearray(b"\xff" * tts.OUTPUT_BLOCKSIZE * 2)
+        tts._output_callback(block, tts.OUTPUT_BLOCKSIZE, None, None)
+        assert not any(block)  # Silence from the next callback on
+        assert not completed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_speak_uses_prespawned_piper(self, tts):
+        await tts._prespawn_piper()
+        standby = tts._piper_proc
+        assert tts.spawned == [standby]
+
+        assert await tts.speak("hello")
+        assert tts.spawned == [standby]  # No spawn on the speak path
+        standby.stdin.write.assert_called_once_with(b"hello")
+        standby.stdin.close.assert_called_once()
+        await tts.cancel_playback()
+
+    @pytest.mark.asyncio
+    async def test_overlapping_prespawns_keep_one_standby(self, tts):
+        await asyncio.gather(tts._prespawn_piper(), tts._prespawn_piper())
+
+        assert len(tts.spawned) == 2
+        kept = [proc for proc in tts.spawned if not proc.killed]
+        assert kept == [tts._piper_proc]
+
+
+class TestPiperDiscovery:
+    """Tests for Piper executable and model discovery with the path cache."""
+
+    @pytest.fixture
+    def home(self, tmp_path, monkeypatch):
+        """Empty home and working directory, cache inside, nothing on PATH."""
+        monkeypatch.setattr("kiro.utils.cache.CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("PATH", str(tmp_path / "path"))
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    @staticmethod
+    def touch(path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch(mode=0o755)
+        return path
+
+    def test_configured_piper_wins_after_fallback_was_found(self, home):
+        from kiro.audio.tts import TextToSpeech
+
+        fallback = self.touch(home / ".local" / "bin" / "piper")
+        configured = home / "cfg" / "piper"
+        assert TextToSpeech(piper_path=configured).piper_path == str(fallback)
+
+        self.touch(configured)
+        assert TextToSpeech(piper_path=configured).piper_path == str(configured)
+
+    def test_piper_on_path_is_cached(self, home, monkeypatch):
+        import shutil
+
+        from kiro.audio.tts import TextToSpeech
+
+        on_path = self.touch(home / "path" / "piper")
+        assert TextToSpeech().piper_path == str(on_path)
+
+        monkeypatch.setattr(shutil, "which", MagicMock(return_value=None))
+        assert TextToSpeech().piper_path == str(on_path)
+        shutil.which.assert_not_called()
+
+    def test_models_dir_wins_after_system_model_was_found(self, home):
+        from kiro.audio.tts import TextToSpeech
+
+        system = self.touch(home / ".local" / "share" / "piper-voices" / "voice.onnx")
+        models_dir = home / "voices"
+        assert TextToSpeech(piper_model="voice", models_dir=models_dir).piper_model == str(system)
+
+        local = self.touch(models_dir / "voice.onnx")
+        assert TextToSpeech(piper_model="voice", models_dir=models_dir).piper_model == str(local)
+
+
+class FakeOnnxSession:
+    """Stand-in for an onnxruntime InferenceSession returning fixed audio."""
+
+    def __init__(self, audio):
+        self.audio = audio
+        self.inputs = []
+
+    def run(self, output_names, inputs):
+        self.inputs.append(inputs)
+        return [self.audio.copy().reshape(1, 1, -1)]
+
+
+PIPER_CONFIG = {
+    "audio": {"sample_rate": 16000},
+    "espeak": {"voice": "en-us"},
+    "phoneme_id_map": {"_": [0], "^": [1], "$": [2], "h": [20], "i": [21]},
+}
+
+
+class TestPiperVoice:
+    """Tests for the in-process Piper voice with a stub ONNX session."""
+
+    def test_synthesize_drives_session(self, monkeypatch):
+        from kiro.audio.piper_onnx import PiperVoice
+
+        phonemize = MagicMock()
+        phonemize.phonemize_espeak.return_value = [["h", "i", "?"], []]
+        monkeypatch.setitem(sys.modules, "piper_phonemize", phonemize)
+        session = FakeOnnxSession(np.array([0.0, 0.5, -0.25], dtype=np.float32))
+
+        voice = PiperVoice(session, PIPER_CONFIG)
+        chunks = list(voice.synthesize("hi"))
+
+        phonemize.phonemize_espeak.assert_called_once_with("hi", "en-us")
+        assert len(session.inputs) == 1  # Empty sentence skipped
+        inputs = session.inputs[0]
+        # BOS, each known phoneme followed by PAD, EOS; unknown "?" dropped
+        assert inputs["input"].tolist() == [[1, 20, 0, 21, 0, 2]]
+        assert inputs["input_lengths"].tolist() == [6]
+        assert "sid" not in inputs
+
+        # Peak-normalized to int16
+        pcm = np.frombuffer(chunks[0], dtype=np.int16)
+        assert pcm.tolist() == [0, 32767, -16383]
+
+    @pytest.mark.asyncio
+    async def test_output_stream_opens_at_voice_sample_rate(self, tmp_path, monkeypatch):
+        from kiro.audio.piper_onnx import PiperVoice
+        from kiro.audio.tts import TextToSpeech
+
+        monkeypatch.setattr("kiro.utils.cache.CACHE_DIR", tmp_path)
+        voice = PiperVoice(FakeOnnxSession(np.zeros(1, dtype=np.float32)), PIPER_CONFIG)
+        monkeypatch.setattr(PiperVoice, "load", staticmethod(lambda model_path: voice))
+        sounddevice = MagicMock()
+        monkeypatch.setitem(sys.modules, "sounddevice", sounddevice)
+
+        tts = TextToSpeech(sample_rate=22050)
+        tts.piper_model = "voice.onnx"
+        await tts.start()
+        try:
+            assert tts.engine == "piper"
+            assert tts.sample_rate == 16000
+            kwargs = sounddevice.RawOutputStream.call_args.kwargs
+            assert kwargs["samplerate"] == 16000
+        finally:
+            await tts.stop()
+
 
 class TestAudioPipeline:
     """Tests for AudioPipeline orchestrator."""
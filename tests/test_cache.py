@@ -0,0 +1,39 @@
+"""
+Tests for the on-disk path cache.
+"""
+
+import json
+from pathlib import Path
+
+from kiro.utils.cache import PathCache
+
+
+class TestPathCache:
+    """Tests for PathCache."""
+
+    def test_roundtrip(self, tmp_path: Path):
+        target = tmp_path / "piper"
+        target.touch()
+        cache_file = tmp_path / "paths.json"
+
+        PathCache(cache_file).set("piper", str(target))
+        assert PathCache(cache_file).get("piper") == str(target)
+
+    def test_missing_path_is_ignored(self, tmp_path: Path):
+        cache_file = tmp_path / "paths.json"
+        PathCache(cache_file).set("piper", str(tmp_path / "gone"))
+        assert PathCache(cache_file).get("piper") is None
+
+    def test_other_version_is_discarded(self, tmp_path: Path):
+        target = tmp_path / "piper"
+        target.touch()
+        cache_file = tmp_path / "paths.json"
+        cache_file.write_text(
+            json.dumps({"version": "0.0.0", "paths": {"piper": str(target)}})
+        )
+        assert PathCache(cache_file).get("piper") is None
+
+    def test_unreadable_file(self, tmp_path: Path):
+        cache_file = tmp_path / "paths.json"
+        cache_file.write_text("not json")
+        assert PathCache(cache_file).get("piper") is None
@@ -65,6 +65,18 @@ class TestLoadYamlConfig:
         result = load_yaml_config(config_file)
         assert result == {}
 
+    def test_reload_after_change(self, tmp_path: Path):
+        config_file = tmp_path / "test.yaml"
+        config_file.write_text("log:\n  level: DEBUG\n")
+        first = load_yaml_config(config_file)
+        first["log"]["level"] = "mutated"
+
+        assert load_yaml_config(config_file)["log"]["level"] == "DEBUG"
+
+        config_file.write_text("log:\n  level: ERROR\n")
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+        assert load_yaml_config(config_file)["log"]["level"] == "ERROR"
+
 
 class TestDeepMerge:
     """Tests for deep dictionary merging."""
@@ -87,6 +99,13 @@ class TestDeepMerge:
         result = deep_merge(base, override)
         assert result == {"a": "simple"}
 
+    def test_inputs_not_modified(self):
+        base = {"outer": {"inner": {"a": 1}}}
+        override = {"outer": {"inner": {"b": 2}}}
+        result = deep_merge(base, override)
+        assert result == {"outer": {"inner": {"a": 1, "b": 2}}}
+        assert base == {"outer": {"inner": {"a": 1}}}
+
 
 class TestKiroConfig:
     """Tests for main configuration class."""
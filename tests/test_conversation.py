@@ -0,0 +1,32 @@
+"""
+Tests for conversation context handling.
+"""
+
+from kiro.conversation.manager import Conversation
+from kiro.llm.gateway import Role
+
+
+class TestConversation:
+    """Tests for Conversation."""
+
+    def test_keeps_last_turns(self):
+        conversation = Conversation(id="test")
+        for i in range(Conversation.MAX_TURNS + 5):
+            conversation.add_turn(Role.USER, f"turn {i}")
+
+        assert conversation.turn_count == Conversation.MAX_TURNS
+        assert conversation.get_messages()[0].content == "turn 5"
+        assert len(conversation.turns) == Conversation.MAX_TURNS
+
+    def test_get_messages_window(self):
+        conversation = Conversation(id="test")
+        conversation.add_turn(Role.USER, "hello")
+        conversation.add_turn(Role.ASSISTANT, "hi")
+        conversation.add_turn(Role.USER, "how are you")
+
+        messages = conversation.get_messages(2)
+        assert [m.content for m in messages] == ["hi", "how are you"]
+        assert messages[0].role == Role.ASSISTANT
+
+        # Earlier turns keep the same Message objects between calls
+        assert conversation.get_messages(2)[0] is messages[0]
@@ -39,6 +39,11 @@ class TestCapturePipeline:
             assert result.intent == expected_intent, f"Failed for: {text}"
             assert result.task_title is not None
 
+    def test_captures_keep_original_casing(self):
+        """Test that extracted text keeps the user's casing."""
+        assert parse_utterance("Jarvis, I NEED TO email Bob").task_title == "Email Bob"
+        assert parse_utterance("Remind me to call İsmail at 5").reminder_message == "call İsmail"
+
     def test_reminder_intent_detection(self):
         """Test that reminder phrases are detected."""
         test_cases = [
@@ -53,6 +58,20 @@ class TestCapturePipeline:
             assert result.intent == CaptureIntent.REMINDER, f"Failed for: {text}"
             assert result.reminder_message is not None
 
+    def test_reminder_message_drops_time_phrase(self):
+        """Test that the trailing time phrase is split off the message."""
+        assert parse_utterance("remind me to call mom tomorrow at 5").reminder_message == "call mom"
+        assert parse_utterance("remind me to go inside at 5").reminder_message == "go inside"
+        # Long whitespace runs must not backtrack quadratically
+        result = parse_utterance("remind me a" + " " * 5000 + "x")
+        assert result.intent == CaptureIntent.REMINDER
+
+    def test_long_repetitive_input(self):
+        """Test that repeated phrases don't make matching quadratic."""
+        for phrase in ("mark ", "is ", "how is ", "add "):
+            parse_utterance(phrase * 20000)
+        assert parse_utterance("mark the mark done").task_reference == "the mark"
+
     def test_query_intent_detection(self):
         """Test that query phrases are detected."""
         test_cases = [
@@ -116,6 +135,18 @@ class TestCapturePipeline:
         assert result.trigger_time is not None
         assert result.trigger_time.hour == 20
 
+    def test_repeated_parse_uses_fresh_copy(self):
+        """Test that cached parses aren't shared and keep times current."""
+        pipeline = CapturePipeline()
+        first = pipeline.parse("remind me in 10 minutes to stretch")
+        first.entities["raw_time"] = "changed"
+        first.trigger_time = None
+
+        second = pipeline.parse("remind me in 10 minutes to stretch ")
+        assert second is not first
+        assert second.entities["raw_time"] != "changed"
+        assert second.trigger_time is not None
+
 
 class TestEFEStore:
     """Tests for database operations."""
@@ -165,6 +196,55 @@ class TestEFEStore:
         assert reminder.message == "Call mom"
         assert reminder.status == ReminderStatus.PENDING
 
+    def test_create_capture_and_task(self, store):
+        """Test that the capture and its task are written together."""
+        task = store.create_capture_and_task(
+            raw_text="I need to buy milk", title="Buy milk", confidence=0.9
+        )
+        assert task.capture_id is not None
+        assert task.source_utterance == "I need to buy milk"
+        assert len(store.get_unprocessed_captures()) == 0
+
+    def test_filtered_task_and_reminder_queries(self, store):
+        """Test date-window and title filters run in the database."""
+        now = datetime.now()
+        store.create_task(title="Buy eggs at Superstore", due_date=now)
+        store.create_task(title="Call 50% off store", due_date=now + timedelta(days=2))
+        done = store.create_task(title="Superstore returns", due_date=now)
+        store.complete_task(done.id)
+        store.create_reminder(message="Now", trigger_time=now)
+        store.create_reminder(message="Later", trigger_time=now + timedelta(days=2))
+
+        window = (now - timedelta(hours=1), now + timedelta(hours=1))
+        assert [t.title for t in store.get_tasks_due_between(*window)] == ["Buy eggs at Superstore"]
+        assert [r.message for r in store.get_reminders_between(*window)] == ["Now"]
+        assert [t.title for t in store.search_pending_tasks("SUPERSTORE")] == ["Buy eggs at Superstore"]
+        assert [t.title for t in store.search_pending_tasks("0%")] == ["Call 50% off store"]
+        assert store.count_pending_tasks() == 2
+
+    def test_count_tasks_by_status(self, store):
+        """Test per-status task counts for a project."""
+        project = store.create_project(name="Garden")
+        store.create_task(title="Dig", project_id=project.id)
+        store.create_task(title="Plant", project_id=project.id)
+        done = store.create_task(title="Buy seeds", project_id=project.id)
+        store.complete_task(done.id)
+        store.create_task(title="Unrelated")
+
+        counts = store.count_tasks_by_status(project.id)
+        assert counts == {TaskStatus.PENDING: 2, TaskStatus.COMPLETED: 1}
+
+    def test_indexes_added_to_existing_database(self, store):
+        """Test that reopening a database restores missing indexes."""
+        from sqlalchemy import inspect, text
+
+        with store.engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_reminder_status_trigger"))
+
+        reopened = EFEStore(db_path=store.db_path)
+        names = {ix["name"] for ix in inspect(reopened.engine).get_indexes("reminders")}
+        assert "ix_reminder_status_trigger" in names
+
     def test_get_due_reminders(self, store):
         """Test getting due reminders."""
         # Create a past reminder (should be due)
@@ -191,6 +271,57 @@ class TestEFEStore:
         assert ack.acknowledged_at is not None
 
 
+class TestReminderScheduler:
+    """Tests for reminder firing."""
+
+    @pytest.mark.asyncio
+    async def test_fires_batch_and_schedules_recurrence(self, tmp_path):
+        """Test that due reminders fire once and recurring ones repeat."""
+        from kiro.efe.scheduler import ReminderScheduler
+
+        store = EFEStore(db_path=str(tmp_path / "test.db"))
+        past = datetime.now() - timedelta(minutes=5)
+        store.create_reminder(message="Stretch", trigger_time=past, recurrence="daily")
+        store.create_reminder(message="Call mom", trigger_time=past)
+
+        fired = []
+
+        async def on_reminder(reminder):
+            fired.append(reminder.message)
+
+        scheduler = ReminderScheduler(store, on_reminder=on_reminder)
+        await scheduler._check_reminders()
+        await scheduler._check_reminders()
+
+        assert sorted(fired) == ["Call mom", "Stretch"]
+        pending = store.get_pending_reminders()
+        assert [r.message for r in pending] == ["Stretch"]
+        assert pending[0].id is not None
+        assert pending[0].trigger_time == past + timedelta(days=1)
+        assert scheduler.get_next_reminder().id == pending[0].id
+
+    @pytest.mark.asyncio
+    async def test_wake_fires_new_reminder_without_polling(self, tmp_path):
+        """Test that an idle scheduler picks up a reminder added later."""
+        from kiro.efe.scheduler import ReminderScheduler
+
+        store = EFEStore(db_path=str(tmp_path / "test.db"))
+        fired = asyncio.Event()
+
+        async def on_reminder(reminder):
+            fired.set()
+
+        scheduler = ReminderScheduler(store, on_reminder=on_reminder)
+        await scheduler.start()
+        try:
+            await asyncio.sleep(0.05)  # Now sleeping for check_interval
+            store.create_reminder(message="Now", trigger_time=datetime.now())
+            scheduler.wake()
+            await asyncio.wait_for(fired.wait(), timeout=2)
+        finally:
+            await scheduler.stop()
+
+
 class TestExecutiveFunctionEngine:
     """Integration tests for the full EFE."""
 
@@ -284,3 +415,54 @@ class TestExecutiveFunctionEngine:
         assert efe.is_efe_intent("what's on my list") is True
         assert efe.is_efe_intent("tell me a joke") is False
         assert efe.is_efe_intent("hello") is False
+
+    @pytest.mark.asyncio
+    async def test_prepare_then_process_parsed(self, efe):
+        """Test routing on a prepared parse without parsing again."""
+        await efe.start()
+        try:
+            parsed = efe.prepare("I need to buy milk")
+            assert parsed.intent == CaptureIntent.TASK
+
+            response = await efe.process_parsed(parsed, "I need to buy milk")
+            assert response is not None
+            assert len(efe.list_tasks()) == 1
+        finally:
+            await efe.stop()
+
+    @pytest.mark.asyncio
+    async def test_completion_matches_on_shared_word(self, efe):
+        """Test that a partial reference completes the one overlapping task."""
+        await efe.start()
+        try:
+            await efe.process("I need to pick up eggs from the store")
+            await efe.process("I need to call the dentist")
+
+            response = await efe.process("I finished the eggs")
+            assert "eggs" in response.lower()
+            assert [t.title for t in efe.list_tasks()] == ["Call the dentist"]
+        finally:
+            await efe.stop()
+
+    @pytest.mark.asyncio
+    async def test_unsnooze_wakes_scheduler(self, efe):
+        """Test that an unsnoozed past-due reminder fires without waiting for a poll."""
+        spoken = asyncio.Event()
+
+        async def on_speak(message):
+            spoken.set()
+
+        efe._on_speak = on_speak
+        reminder = efe.add_reminder("Stretch", datetime.now() + timedelta(hours=1))
+        efe.snooze_reminder(reminder.id)
+        with efe.store._get_session() as session:
+            session.get(Reminder, reminder.id).trigger_time = datetime.now() - timedelta(minutes=1)
+            session.commit()
+
+        await efe.start()
+        try:
+            await asyncio.sleep(0.05)  # Scheduler now asleep
+            efe.unsnooze_reminder(reminder.id)
+            await asyncio.wait_for(spoken.wait(), timeout=2)
+        finally:
+            await efe.stop()
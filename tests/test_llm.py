@@ -0,0 +1,118 @@
+"""
+Tests for the LLM gateway.
+"""
+
+import asyncio
+
+import pytest
+
+from kiro.llm.gateway import LLMGateway, LLMResponse, Message, Role
+
+
+class _SlowProvider:
+    """Provider stub that counts calls and answers after a short delay."""
+
+    name = "stub"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, messages, **kwargs) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return LLMResponse(content=messages[-1].content, model="stub", provider=self.name)
+
+
+class _HangingProvider:
+    """Provider stub that never answers and records being cancelled."""
+
+    name = "hanging"
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def generate(self, messages, **kwargs) -> LLMResponse:
+        self.started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return LLMResponse(content="", model="stub", provider=self.name)
+
+
+class TestLLMGateway:
+    """Tests for LLMGateway."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_a_call(self):
+        provider = _SlowProvider()
+        gateway = LLMGateway(primary_provider=provider)
+        await gateway.start()
+
+        same = [Message(role=Role.USER, content="hello")]
+        other = [Message(role=Role.USER, content="goodbye")]
+        results = await asyncio.gather(
+            gateway.generate(same),
+            gateway.generate(list(same)),
+            gateway.generate(other),
+        )
+
+        assert [r.content for r in results] == ["hello", "hello", "goodbye"]
+        assert provider.calls == 2
+
+        # Completed requests aren't reused
+        await gateway.generate(same)
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelling_sole_caller_cancels_provider_call(self):
+        provider = _HangingProvider()
+        gateway = LLMGateway(primary_provider=provider)
+        await gateway.start()
+
+        same = [Message(role=Role.USER, content="hello")]
+        first = asyncio.create_task(gateway.generate(same))
+        second = asyncio.create_task(gateway.generate(list(same)))
+        await provider.started.wait()
+
+        # Another caller is still waiting, so the call keeps running
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not provider.cancelled
+
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert provider.cancelled
+        assert not gateway._inflight
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_inflight_calls(self):
+        provider = _HangingProvider()
+        gateway = LLMGateway(primary_provider=provider)
+        await gateway.start()
+
+        caller = asyncio.create_task(gateway.generate([Message(role=Role.USER, content="hi")]))
+        await provider.started.wait()
+        await gateway.stop()
+
+        assert provider.cancelled
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+    @pytest.mark.asyncio
+    async def test_new_request_after_cancel_gets_its_own_call(self):
+        provider = _SlowProvider()
+        gateway = LLMGateway(primary_provider=provider)
+        await gateway.start()
+
+        same = [Message(role=Role.USER, content="hello")]
+        abandoned = asyncio.create_task(gateway.generate(same))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        await asyncio.gather(abandoned, return_exceptions=True)
+
+        response = await gateway.generate(list(same))
+        assert response.content == "hello"